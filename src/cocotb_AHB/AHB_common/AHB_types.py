@@ -2,22 +2,36 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import enum
-from collections import namedtuple
-from typing import Dict, Any, Tuple, NamedTuple
+import functools
+from typing import Dict, Any, NamedTuple
 
-class HREADY(enum.IntEnum):
+
+class _FastEnumMeta(enum.EnumMeta):
+    # Enums are looked up by value on every simulated clock cycle, resolve
+    # plain values with a single dict access instead of the generic
+    # EnumMeta.__call__ path
+    def __call__(cls, value: Any, *args: Any, **kwargs: Any) -> Any:
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class HREADY(enum.IntEnum, metaclass=_FastEnumMeta):
     WaitState = 0b0
     Working   = 0b1
 
-class HRESP(enum.IntEnum):
+class HRESP(enum.IntEnum, metaclass=_FastEnumMeta):
     Successful = 0b0
     Failed     = 0b1
 
-class HEXOKAY(enum.IntEnum):
+class HEXOKAY(enum.IntEnum, metaclass=_FastEnumMeta):
     Failed     = 0b0
     Successful = 0b1
 
-class HBURST(enum.IntEnum):
+class HBURST(enum.IntEnum, metaclass=_FastEnumMeta):
     Single = 0b0
     Incr   = 0b1
     Wrap4  = 0b10
@@ -27,7 +41,7 @@ class HBURST(enum.IntEnum):
     Wrap16 = 0b110
     Incr16 = 0b111
 
-class HMASTLOCK(enum.IntEnum):
+class HMASTLOCK(enum.IntEnum, metaclass=_FastEnumMeta):
     UnLocked = 0b0
     Locked   = 0b1
 
@@ -43,14 +57,22 @@ class HPROT(NamedTuple):
     shareable: bool = False
 
 
+@functools.lru_cache(maxsize=128)
 def hProt_to_int(hProt: HPROT) -> int:
-    ret = 0
-    for i in range(hProt.width):
-        ret | hProt[i+1] << i;
-    return ret
+    return (hProt.data | hProt.privileged << 1 | hProt.bufferable << 2 |
+            hProt.modifiable << 3 | hProt.lookup << 4 |
+            hProt.allocate << 5 | hProt.shareable << 6)
+
 
+_HPROT_TABLE = tuple(HPROT(7, *(bool(value >> i & 1) for i in range(7)))
+                     for value in range(1 << 7))
 
-class HSIZE(enum.IntEnum):
+
+def int_to_hProt(value: int) -> HPROT:
+    return _HPROT_TABLE[value]
+
+
+class HSIZE(enum.IntEnum, metaclass=_FastEnumMeta):
     Byte        = 0b0
     Halfword    = 0b1
     Word        = 0b10
@@ -60,36 +82,38 @@ class HSIZE(enum.IntEnum):
     Bit512      = 0b110
     Bit1024     = 0b111
 
-class HNONSEC(enum.IntEnum):
+class HNONSEC(enum.IntEnum, metaclass=_FastEnumMeta):
     Secure    = 0b0
     NonSecure = 0b1
 
-class HEXCL(enum.IntEnum):
+class HEXCL(enum.IntEnum, metaclass=_FastEnumMeta):
     NonExcl = 0b0
     Excl    = 0b1
 
-class HTRANS(enum.IntEnum):
+class HTRANS(enum.IntEnum, metaclass=_FastEnumMeta):
     Idle   = 0b0
     Busy   = 0b1
     NonSeq = 0b10
     Seq    = 0b11
 
-class HWRITE(enum.IntEnum):
+class HWRITE(enum.IntEnum, metaclass=_FastEnumMeta):
     Read  = 0b0
     Write = 0b1
 
-class HSEL(enum.IntEnum):
+class HSEL(enum.IntEnum, metaclass=_FastEnumMeta):
     NotSel = 0b0
     Sel    = 0b1
 
-class HREADYOUT(enum.IntEnum):
+class HREADYOUT(enum.IntEnum, metaclass=_FastEnumMeta):
     NotReady = 0b0
     Ready    = 0b1
 
 class HMONITOR():
+    __slots__ = ("is_manager", "ready", "command", "resp", "wdata")
+
     def __init__(self, manager: bool =True):
-        self_is_manager = manager
-        self.ready: bool
+        self.is_manager: bool = manager
+        self.ready: bool = False
         self.command: Dict[Any, Any] = {}
         self.resp: Dict[Any, Any] = {}
         self.wdata: int = 0
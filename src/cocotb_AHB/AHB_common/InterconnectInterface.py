@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import TypeVar, Optional
-from abc import ABC
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadWrite # type: ignore
@@ -14,7 +13,7 @@ from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 T = TypeVar('T')
 S = TypeVar('S', bound='InterconnectWrapper')
 
-class InterconnectInterface(ABC):
+class InterconnectInterface:
     def register_manager(self: T, manager: ManagerInterface,
                          interconnect_id: Optional[int] = None,
                          name: Optional[str] = None) -> T:
@@ -51,7 +50,8 @@ class InterconnectWrapper(SimulationInterface):
         assert self.interconnect is not None, "Interconnect not defined"
         clock_edge = RisingEdge(self.clock)
         readwrite = ReadWrite()
+        process = self.interconnect.process
         while True:
             await readwrite
-            await self.interconnect.process()
+            await process()
             await clock_edge
@@ -1,12 +1,11 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple, Dict, Any
+from typing import Dict, Any
 
-from abc import ABC
 from cocotb_AHB.AHB_common.AHB_types import *
 
-class ManagerInterface(ABC):
+class ManagerInterface:
     _signals = ["haddr", "hsize", "htrans", "hwdata",
                 "hwrite", "hrdata", "hready", "hresp"]
     _optional_signals = ["hburst", "hmastlock","hprot", "hnonsec",
@@ -33,6 +32,8 @@ class ManagerInterface(ABC):
     @property
     def _default_opt(self) -> Dict[Any, Any]:
         return {"hburst": HBURST.Incr,
+                "hmastlock": HMASTLOCK.UnLocked,
+                "hprot": hProt_to_int(HPROT()),
                 "hnonsec": HNONSEC.Secure,
                 "hexcl": HEXCL.NonExcl,
                 "hmaster": 0,
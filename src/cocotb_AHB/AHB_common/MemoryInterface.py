@@ -1,10 +1,9 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from abc import ABC
 from typing import List
 
-class MemoryInterface(ABC):
+class MemoryInterface:
     def init_memory(self, init_array: List[int], start_address: int) -> None:
         raise Exception("Unimplemented")
 
@@ -1,17 +1,25 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, Any, TypeVar
+from typing import Dict, Any, TypeVar, Union, Tuple, Iterable
 
-from abc import ABC
-from cocotb.handle import SimHandleBase # type: ignore
 from cocotb_AHB.AHB_common.AHB_types import *
 from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 from cocotb_AHB.AHB_common.MonitorableInterface import MonitorableInterface
 
 T = TypeVar('T')
-
-class MonitorInterface(ABC):
+# Packets keep either the monitor's dict or the command/response NamedTuple
+# itself, both are stored by reference
+Payload = Union[Dict[Any, Any], MCMD, ICMD, SRESP, IRESP]
+
+_CAPITALIZED: Dict[str, str] = {
+    key: key.capitalize() for key in
+    ("haddr", "hburst", "hmastlock", "hprot", "hsize", "hnonsec", "hexcl",
+     "hmaster", "htrans", "hwdata", "hwstrb", "hwrite", "hsel", "hrdata",
+     "hready", "hreadyout", "hresp", "hexokay",
+     *ICMD._fields, *SRESP._fields, *IRESP._fields)}
+
+class MonitorInterface:
     def register_device(self: T, device: MonitorableInterface) -> T:
         raise Exception("Unimplemented")
 
@@ -20,22 +28,37 @@ class SimMonitorInterface(MonitorInterface, SimulationInterface):
     pass
 
 
+# Payloads handed to cmd()/rsp() are kept by reference, callers must not
+# mutate them afterwards
 class Packet:
+    __slots__ = ("part_of_burst", "command", "_wdata", "resp", "_age")
+
     def __init__(self) -> None:
         self.part_of_burst: bool = False
-        self.command: Dict[Any, Any] = {}
+        self.command: Payload = {}
         self._wdata: int = 0
-        self.resp: Dict[Any, Any] = {}
+        self.resp: Payload = {}
         self._age: int = 0
 
 
+    def reset(self) -> None:
+        self.part_of_burst = False
+        self.command = {}
+        self._wdata = 0
+        self.resp = {}
+        self._age = 0
+
+
     def age(self) -> None:
         self._age += 1
 
 
-    def cmd(self, command: Dict[Any, Any]) -> None:
-        if "hburst" in command.keys() and \
-            command["hburst"] != HBURST.Single:
+    def cmd(self, command: Payload) -> None:
+        if isinstance(command, tuple):
+            if command.hBurst != HBURST.Single: # type: ignore
+                self.part_of_burst = True
+        elif command.get("hburst", HBURST.Single) != HBURST.Single or \
+             command.get("hBurst", HBURST.Single) != HBURST.Single:
             self.part_of_burst = True
         self.command = command
 
@@ -44,28 +67,35 @@ class Packet:
         self._wdata = wdata
 
 
-    def rsp(self, resp: Dict[Any, Any]) -> None:
+    def rsp(self, resp: Payload) -> None:
         self.resp = resp
 
 
+    @staticmethod
+    def _fields_str(fields: Payload) -> str:
+        ret = []
+        items: Iterable[Tuple[str, Any]]
+        if isinstance(fields, tuple):
+            items = zip(fields._fields, fields)
+        else:
+            items = fields.items()
+        for key, value in items:
+            name = _CAPITALIZED.get(key)
+            if name is None:
+                name = key.capitalize()
+            if type(value) is not int:
+                ret.append(f" {name}: {value!s};")
+            else:
+                ret.append(f" {name}: {value:#x};")
+        return "".join(ret)
+
+
     def __str__(self) -> str:
         _cmd = "Command:\n\t"
         if self.part_of_burst:
             _cmd = "Part of Burst;\n\t"
-        for key, value in self.command.items():
-            _cmd += " " + key.capitalize() + ": "
-            if type(value) is not int:
-                _cmd += str(value) + ";"
-            else:
-                _cmd += str(hex(value)) + ";"
-        _cmd += f"WData: {self._wdata}"
-        _resp = "Response:\n\t"
-        for key, value in self.resp.items():
-            _resp += " " + key.capitalize() + ": "
-            if type(value) is not int:
-                _resp += str(value) + ";"
-            else:
-                _resp += str(hex(value)) + ";"
+        _cmd += self._fields_str(self.command) + f"WData: {self._wdata}"
+        _resp = "Response:\n\t" + self._fields_str(self.resp)
         if len(self.command) == 0:
             return "Response to reset command;\n" + _resp
         return _cmd + "\n" + _resp + "\n" + f"Took {self._age} cycles"
@@ -1,18 +1,15 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
-
-from abc import ABC
 from cocotb_AHB.AHB_common.AHB_types import *
 
-class SubordinateInterface(ABC):
+class SubordinateInterface:
     _signals = ["haddr", "hsize", "htrans", "hwdata",
                 "hwrite", "hrdata", "hready", "hreadyout",
                 "hresp", "hsel"]
     _optional_signals = ["hburst", "hmastlock", "hprot", "hnonsec",
                          "hexcl", "hmaster", "hwstrb", "hexokay"]
-    _command_signals = ["haddr", "hbrust", "hmastlock", "hprot",
+    _command_signals = ["haddr", "hburst", "hmastlock", "hprot",
                         "hsize", "hnonsec", "hexcl", "hmaster",
                         "htrans", "hwdata", "hwstrb", "hwrite",
                         "hsel"]
@@ -1,7 +1,7 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Tuple, List
+from typing import Any, Tuple, Dict, Callable
 from math import log2
 
 from cocotb.handle import SimHandleBase # type: ignore
@@ -10,6 +10,20 @@ from cocotb_AHB.AHB_common.AHB_types import *
 from cocotb_AHB.AHB_common.ManagerInterface import ManagerInterface
 from cocotb_AHB.AHB_common.MonitorableInterface import MonitorableInterface
 
+# conversion of the sampled value of each MCMD field
+_CMD_CONVERT: Dict[str, Callable[[int], Any]] = {
+    "hAddr": int, "hBurst": HBURST, "hMastlock": HMASTLOCK, "hProt": int_to_hProt,
+    "hSize": HSIZE, "hNonsec": HNONSEC, "hExcl": HEXCL, "hMaster": int,
+    "hTrans": HTRANS, "hWstrb": int, "hWrite": HWRITE}
+
+
+def _signal_getter(handle: Any, convert: Callable[[int], Any]) -> Callable[[], Any]:
+    return lambda: convert(int(handle.value))
+
+
+def _constant_getter(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
 
 class DUTManager(ManagerInterface, MonitorableInterface):
     def __init__(self, entity: SimHandleBase, bus_width: int, name: str ="", **kwargs: Any):
@@ -17,9 +31,22 @@ class DUTManager(ManagerInterface, MonitorableInterface):
         self.bus = Bus(entity, name, self._signals, self._optional_signals, **kwargs)
         for name in self._optional_signals:
             setattr(self, "has_" + name, True)
-            if getattr(self.bus, name) is None:
+            if not hasattr(self.bus, name):
                 setattr(self, "has_" + name, False)
                 setattr(self, "default_" + name, self._default_opt[name])
+        self._monitor_cmd_handles = tuple(
+            (s, getattr(self.bus, s)) for s in self._command_signals
+            if s in self._signals or getattr(self, "has_" + s))
+        self._monitor_resp_handles = tuple(
+            (s, getattr(self.bus, s)) for s in self._resp_signals
+            if s in self._signals or getattr(self, "has_" + s))
+        # one getter per MCMD field, MCMD fields without a signal
+        # return their converted default
+        self._cmd_getters: Tuple[Callable[[], Any], ...] = tuple(
+            _signal_getter(getattr(self.bus, field.lower()), _CMD_CONVERT[field])
+            if getattr(self, "has_" + field.lower(), True) else
+            _constant_getter(_CMD_CONVERT[field](getattr(self, "default_" + field.lower())))
+            for field in MCMD._fields)
 
 
     def set_ready(self, hReady: HREADY) -> None:
@@ -27,31 +54,20 @@ class DUTManager(ManagerInterface, MonitorableInterface):
 
 
     def is_ready(self) -> bool:
-        return HREADY(self.bus.hready.value) == HREADY.Working
+        return int(self.bus.hready.value) == HREADY.Working
 
 
     def put_rsp(self, resp: IRESP) -> None:
         self.bus.hresp.value = resp.hResp
         self.bus.hrdata.value = resp.hRData
         if getattr(self, "has_hexokay"):
-            self.bus.hexokay = resp.hExOkay
+            self.bus.hexokay.value = resp.hExOkay
         else:
             self.default_exokay = resp.hExOkay
 
 
     def get_cmd(self) -> MCMD:
-        _temp = []
-        for i, out_signal in enumerate(self._command_signals):
-            if out_signal in self._optional_signals and \
-               getattr(self, "has_" + out_signal) or \
-               out_signal not in self._optional_signals:
-                _temp.append(getattr(self.bus, out_signal).value)
-            else:
-                _temp.append(getattr(self, "default_" + out_signal))
-        return MCMD(int(_temp[0]), HBURST(_temp[1]), HMASTLOCK(_temp[2]),
-                    HPROT(_temp[3]), HSIZE(_temp[4]), HNONSEC(_temp[5]),
-                    HEXCL(_temp[6]), int(_temp[7]), HTRANS(_temp[8]),
-                    int(_temp[10]), HWRITE(_temp[11]))
+        return MCMD(*[getter() for getter in self._cmd_getters])
 
 
     def get_data(self) -> MDATA:
@@ -61,15 +77,7 @@ class DUTManager(ManagerInterface, MonitorableInterface):
     async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR()
         monit.ready = self.is_ready()
-        for signal in self._command_signals:
-            if signal in self._signals or \
-               getattr(self, "has_" + signal):
-                monit.command[signal] = hex(getattr(self.bus, signal).value)
-
-        for signal in self._resp_signals:
-            if signal in self._signals or \
-               getattr(self, "has_" + signal):
-                monit.resp[signal] = hex(getattr(self.bus, signal).value)
-
+        monit.command = {s: int(h.value) for s, h in self._monitor_cmd_handles}
+        monit.resp = {s: int(h.value) for s, h in self._monitor_resp_handles}
         monit.wdata = int(self.bus.hwdata.value)
         return monit
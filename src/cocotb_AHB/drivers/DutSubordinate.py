@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Any, Tuple
+from operator import attrgetter
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb_bus.bus import Bus # type: ignore
@@ -9,6 +10,10 @@ from cocotb_AHB.AHB_common.AHB_types import *
 from cocotb_AHB.AHB_common.SubordinateInterface import SubordinateInterface
 
 
+def _get_hprot(cmd: ICMD) -> int:
+    return hProt_to_int(cmd.hProt)
+
+
 class DUTSubordinate(SubordinateInterface):
     def __init__(self, entity: SimHandleBase, bus_width: int, name: str = "", **kwargs: Any):
         self.bus_width = bus_width
@@ -17,6 +22,16 @@ class DUTSubordinate(SubordinateInterface):
             setattr(self, "has_" + name, True)
             if not hasattr(self.bus, name):
                 setattr(self, "has_" + name, False)
+        self._monitor_cmd_handles = tuple(
+            (s, getattr(self.bus, s)) for s in self._command_signals
+            if s in self._signals or getattr(self, "has_" + s))
+        self._monitor_resp_handles = tuple(
+            (s, getattr(self.bus, s)) for s in self._resp_signals
+            if s in self._signals or getattr(self, "has_" + s))
+        self._put_table = [(getattr(self.bus, field.lower()),
+                            _get_hprot if field == "hProt" else attrgetter(field))
+                           for field in ICMD._fields
+                           if getattr(self, "has_" + field.lower(), True)]
 
 
     def set_ready(self, hReady: HREADY) -> None:
@@ -24,59 +39,32 @@ class DUTSubordinate(SubordinateInterface):
 
 
     def is_ready(self) -> bool:
-        return HREADY(self.bus.hready.value) == HREADY.Working
+        return int(self.bus.hready.value) == HREADY.Working
 
 
     def get_rsp(self) -> SRESP:
         exokay = HEXOKAY.Failed
         if getattr(self, "has_hexokay"):
-            exokay = HEXOKAY(self.bus.hexokay.value)
+            exokay = HEXOKAY(int(self.bus.hexokay.value))
         return SRESP(hRData=int(self.bus.hrdata.value),
-                     hReadyOut=HREADYOUT(self.bus.hreadyout.value),
-                     hResp=HRESP(self.bus.hresp.value),
+                     hReadyOut=HREADYOUT(int(self.bus.hreadyout.value)),
+                     hResp=HRESP(int(self.bus.hresp.value)),
                      hExOkay=exokay)
 
 
     def put_cmd(self, cmd: ICMD) -> None:
-        self.bus.haddr.value  = cmd.hAddr
-        self.bus.hsize.value  = cmd.hSize
-        self.bus.htrans.value = cmd.hTrans
-        self.bus.hwrite.value = cmd.hWrite
-        self.bus.hsel.value   = cmd.hSel
-        if getattr(self, "has_hburst"):
-            self.bus.hburst.value = cmd.hBurst
-        if getattr(self, "has_hmastlock"):
-            self.bus.hmastlock.value = cmd.hMastlock
-        if getattr(self, "has_hprot"):
-            self.bus.hprot.value = hProt_to_int(cmd.hProt)
-        if getattr(self, "has_hnonsec"):
-            self.bus.hnonsec.value = cmd.hNonsec
-        if getattr(self, "has_hexcl"):
-            self.bus.hexcl.value = cmd.hExcl
-        if getattr(self, "has_hmaster"):
-            self.bus.hmaster.value = cmd.hMaster
-        if getattr(self, "has_hwstrb"):
-            self.bus.hwstrb.value = cmd.hWstrb
+        for handle, get in self._put_table:
+            handle.value = get(cmd)
 
 
     def put_data(self, data: IDATA) -> None:
         self.bus.hwdata.value = data.hWData
 
 
-    async def monitor_get_status(self) ->  HMONITOR:
+    async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR(False)
-        for signal in self._command_signals:
-            if signal in self._signals or \
-               getattr(self, "has_" + signal):
-                monit.command[signal] = getattr(self.bus, signal).value
-
-        for signal in self._resp_signals:
-            if signal in self._signals or \
-               getattr(self, "has_" + signal):
-                monit.command[signal] = getattr(self.bus, signal).value
-
-        monit.wdata = int(self.bus.hwdata.value)
         monit.ready = self.is_ready()
+        monit.command = {s: int(h.value) for s, h in self._monitor_cmd_handles}
+        monit.resp = {s: int(h.value) for s, h in self._monitor_resp_handles}
+        monit.wdata = int(self.bus.hwdata.value)
         return monit
-
-
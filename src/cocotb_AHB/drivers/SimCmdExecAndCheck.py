@@ -1,7 +1,7 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Dict, Any, TypeVar, Tuple
+from typing import List, TypeVar, Tuple
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly, ReadWrite, Event # type: ignore
@@ -12,17 +12,23 @@ from cocotb_AHB.AHB_common.ManagerInterface import ManagerInterface
 from cocotb_AHB.AHB_common.MonitorableInterface import MonitorableInterface
 
 T = TypeVar('T')
+# shared, NamedTuples are immutable
+_MDATA_ZERO: MDATA = MDATA(0)
 
 class SimCmdExecAndCheck(SimulationInterface, ManagerInterface, MonitorableInterface):
     def __init__(self, commands: List[Tuple[MCMD, MDATA]], responds: List[IRESP]) -> None:
         self.commands = commands
+        # Commands and their write data are kept in separate lists so get_cmd
+        # indexes once per field instead of going through the pair tuple
+        self._commands: List[MCMD] = [cmd for cmd, _ in commands]
+        self._wdata: List[MDATA] = [data for _, data in commands]
         self.responds = responds
         self.ready: HREADY
         self.cnt: int = 0
         self.r_cnt: int = 0
         self.eval_done: Event = Event()
-        self.send_command: MCMD = MCMD(*self._reset_value)
-        self.resp: Dict[Any, Any] = {}
+        self.send_command: MCMD = self._reset_value
+        self.resp: IRESP = IRESP()
         self.valid_cmd: bool = False
         self.bus_width: int = 32
         self.to_be_delayed: MDATA = MDATA()
@@ -50,31 +56,28 @@ class SimCmdExecAndCheck(SimulationInterface, ManagerInterface, MonitorableInter
 
     async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR(False)
-        await self.eval_done.wait()
+        self._monitoring = True
+        if not self.eval_done.is_set():
+            await self.eval_done.wait()
         self.eval_done.clear()
-        for signal, value in zip(self.send_command._fields, self.send_command):
-            monit.command[signal] = value
-
-        for signal, value in self.resp.items():
-            monit.resp[signal] = value
-
+        monit.command = self.send_command._asdict()
+        monit.resp = self.resp._asdict()
         monit.wdata = self.delayed.hWData
         monit.ready = self.is_ready()
         return monit
 
     def put_rsp(self, rsp: IRESP) -> None:
-        self.resp["hRData"] = rsp.hRData
-        self.resp["hResp"] = rsp.hResp
-        self.resp["hExOkay"] = rsp.hExOkay
+        self.resp = rsp
 
 
     def get_cmd(self) -> MCMD:
-        if self.cnt < len(self.commands):
-            self.to_be_delayed = self.commands[self.cnt][1]
-            self.send_command = self.commands[self.cnt][0]
-            return self.commands[self.cnt][0]
-        self.to_be_delayed = MDATA(0)
-        return MCMD()
+        cnt = self.cnt
+        if cnt < len(self._commands):
+            self.to_be_delayed = self._wdata[cnt]
+            self.send_command = self._commands[cnt]
+            return self.send_command
+        self.to_be_delayed = _MDATA_ZERO
+        return self._reset_value
 
 
     def get_data(self) -> MDATA:
@@ -93,19 +96,23 @@ class SimCmdExecAndCheck(SimulationInterface, ManagerInterface, MonitorableInter
     async def start(self) -> None:
         clock_edge = RisingEdge(self.clock)
         readonly = ReadOnly()
-        while self.r_cnt != len(self.responds):
+        responds = self.responds
+        responds_len = len(responds)
+        eval_done = self.eval_done
+        while self.r_cnt != responds_len:
             await readonly
             if self.is_reset():
                 self.do_reset()
-            elif self.is_ready() or self.resp["hResp"] == HRESP.Failed:
-                if self.cnt > 0 and self.is_ready():
-                    try:
-                        assert self.responds[self.r_cnt] == IRESP(**self.resp), f'{self.r_cnt} {self.responds[self.r_cnt]} , {IRESP(**self.resp)}'
-                    except Exception:
-                        await clock_edge
-                        raise
-                    self.r_cnt += 1
-                self.cnt += 1
-            self.eval_done.set()
+            else:
+                ready = self.is_ready()
+                if ready or self.resp.hResp == HRESP.Failed:
+                    if ready and self.cnt > 0:
+                        if responds[self.r_cnt] != self.resp:
+                            await clock_edge
+                            assert False, f'{self.r_cnt} {responds[self.r_cnt]} , {self.resp}'
+                        self.r_cnt += 1
+                    self.cnt += 1
+            if self._monitoring:
+                eval_done.set()
             await clock_edge
             self.delayed = self.to_be_delayed
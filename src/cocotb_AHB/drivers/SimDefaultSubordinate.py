@@ -1,7 +1,7 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple, Dict, Any, List, TypeVar
+from typing import Tuple, List, TypeVar
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly, Event  # type: ignore
@@ -12,6 +12,16 @@ from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 
 T = TypeVar('T')
 
+# (hResp, wait_cycles) answered for each HTRANS, indexed by its value
+_TRANS_RESULT: Tuple[Tuple[HRESP, int], ...] = (
+    (HRESP.Successful, 0), # Idle
+    (HRESP.Successful, 0), # Busy
+    (HRESP.Failed, 1),     # NonSeq
+    (HRESP.Failed, 1))     # Seq
+# Transfer size in bytes and its alignment mask, indexed by HSIZE
+_SIZE_BYTES: Tuple[int, ...] = tuple(1 << size for size in HSIZE)
+_SIZE_MASKS: Tuple[int, ...] = tuple((1 << size) - 1 for size in HSIZE)
+
 class SimDefaultSubordinate(SubordinateInterface, MonitorableInterface, SimulationInterface):
     def __init__(self, length: int, bus_width: int):
 
@@ -26,9 +36,11 @@ class SimDefaultSubordinate(SubordinateInterface, MonitorableInterface, Simulati
         self.length: int = length
         self.bus_width: int = bus_width
         self.bus_byte_width: int = bus_byte_width
-        self.temp: Dict[Any, Any] = {}
-        self.resp: SRESP = SRESP(*self._reset_value)
-        self.old_resp: SRESP = SRESP(*self._reset_value)
+        self._t_hResp: HRESP = HRESP.Successful
+        self._t_hExOkay: HEXOKAY = HEXOKAY.Failed
+        self._t_hRData: int = 0
+        self.resp: SRESP = self._reset_value
+        self.old_resp: SRESP = self._reset_value
         self.wait_cycles: int  = 0
         self.error: bool = False
         self.input: ICMD = ICMD()
@@ -61,26 +73,20 @@ class SimDefaultSubordinate(SubordinateInterface, MonitorableInterface, Simulati
 
 
     def get_rsp(self) -> SRESP:
-        return SRESP(*self.resp)
+        return self.resp
 
 
     def put_cmd(self, cmd: ICMD) -> None:
-        temp: Dict[Any, Any] = {}
-        temp['hAddr']  = cmd.hAddr
-        temp['hSize']  = cmd.hSize
-        temp['hTrans'] = cmd.hTrans
-        temp['hWrite'] = cmd.hWrite
-        temp['hSel']   = cmd.hSel
-        self.input = ICMD(**temp)
+        self.input = ICMD(hAddr=cmd.hAddr, hSize=cmd.hSize, hTrans=cmd.hTrans,
+                          hWrite=cmd.hWrite, hSel=cmd.hSel)
         if not self.is_ready():
             return
-        temp['hAddr']  %= self.length
-        self.command = ICMD(*self.input)
+        self.command = self.input
         if cmd.hSel == HSEL.Sel:
-            if cmd.hAddr % 2**cmd.hSize != 0:
+            if cmd.hAddr & _SIZE_MASKS[cmd.hSize]:
                 raise Exception("Unaligned address is not permited")
-            if self.bus_byte_width < 2**cmd.hSize:
-                raise Exception(f"HSIZE:{2**cmd.hSize} greater then bus width: {self.bus_byte_width}")
+            if self.bus_byte_width < _SIZE_BYTES[cmd.hSize]:
+                raise Exception(f"HSIZE:{_SIZE_BYTES[cmd.hSize]} greater then bus width: {self.bus_byte_width}")
 
 
     def put_data(self, data: IDATA) -> None:
@@ -88,15 +94,13 @@ class SimDefaultSubordinate(SubordinateInterface, MonitorableInterface, Simulati
 
 
     async def monitor_get_status(self) ->  HMONITOR:
-        await self.eval_done.wait()
+        self._monitoring = True
+        if not self.eval_done.is_set():
+            await self.eval_done.wait()
         self.eval_done.clear()
         monit = HMONITOR(False)
-        for signal, value in zip(self.input._fields, self.input):
-            monit.command[signal] = value
-
-        for signal, value in zip(self.old_resp._fields, self.old_resp):
-            monit.resp[signal] = value
-
+        monit.command = self.input._asdict()
+        monit.resp = self.old_resp._asdict()
         monit.wdata= self.wdata
         monit.ready = self.is_ready()
         return monit
@@ -109,38 +113,33 @@ class SimDefaultSubordinate(SubordinateInterface, MonitorableInterface, Simulati
     def do_reset(self) -> None:
         self.error = False
         self.wait_cycles = 0
-        self.resp = SRESP(*self._reset_value)
+        self.resp = self._reset_value
 
 
     def process(self) -> None:
         self.error = False
-        self.temp["hRData"] = 0
-        self.temp["hResp"] = HRESP.Successful
-        if self.command.hTrans in [HTRANS.Idle, HTRANS.Busy]:
-            self.wait_cycles = 0
-        else:
-            self.temp["hResp"] = HRESP.Failed
-            self.wait_cycles = 1
+        self._t_hRData = 0
+        self._t_hResp, self.wait_cycles = _TRANS_RESULT[self.command.hTrans]
 
 
     async def start(self) -> None:
         clock_edge = RisingEdge(self.clock)
         readonly = ReadOnly()
-        self.temp = {}
+        eval_done = self.eval_done
         while True:
             await readonly
-            self.old_resp = SRESP(*self.resp)
+            self.old_resp = self.resp
             if self.is_reset():
                 self.do_reset()
             elif self.is_ready() and self.command.hSel == HSEL.Sel:
                 self.process()
 
-            if self.wait_cycles == 0: # mark response as avlid
-                self.temp['hReadyOut'] = HREADYOUT.Ready
-            else:
-                self.temp['hReadyOut'] = HREADYOUT.NotReady
-
-            self.resp = SRESP(**self.temp)
+            # mark response as valid
+            self.resp = SRESP(self._t_hResp,
+                              HREADYOUT.Ready if self.wait_cycles == 0 else
+                              HREADYOUT.NotReady,
+                              self._t_hExOkay, self._t_hRData)
             self.wait_cycles -= 1
-            self.eval_done.set()
+            if self._monitoring:
+                eval_done.set()
             await clock_edge
@@ -4,7 +4,6 @@
 from numpy.random import default_rng # type: ignore
 
 from typing import Any, Tuple, Dict, List, Set, TypeVar
-from copy import copy
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly, Event # type: ignore
@@ -17,6 +16,29 @@ from cocotb_AHB.AHB_common.MemoryInterface import MemoryInterface
 
 T = TypeVar('T')
 
+_POISSON_BATCH: int = 4096
+_IDLE_BUSY: Tuple[HTRANS, ...] = (HTRANS.Idle, HTRANS.Busy)
+# Byte mask of 8 consecutive bytes, indexed by their write strobes
+_STROBE_BYTES: Tuple[bytes, ...] = tuple(bytes(0xFF if strb >> i & 1 else 0 for i in range(8))
+                                         for strb in range(256))
+
+_BURST_BEATS: Dict[HBURST, int] = {HBURST.Incr4: 4, HBURST.Wrap4: 4,
+                                   HBURST.Incr8: 8, HBURST.Wrap8: 8,
+                                   HBURST.Incr16: 16, HBURST.Wrap16: 16}
+_INCR_BURSTS: Tuple[HBURST, ...] = (HBURST.Incr4, HBURST.Incr8, HBURST.Incr16)
+# Address offsets of the remaining beats of a fixed length burst, keyed by
+# (hBurst, hSize, index of the first beat within the wrap boundary)
+_BURST_OFFSETS: Dict[Tuple[HBURST, HSIZE, int], Tuple[int, ...]] = {}
+for _burst, _beats in _BURST_BEATS.items():
+    for _hsize in HSIZE:
+        if _burst in _INCR_BURSTS:
+            _BURST_OFFSETS[_burst, _hsize, 0] = \
+                tuple(i << _hsize for i in range(1, _beats))
+        else:
+            for _first in range(_beats):
+                _BURST_OFFSETS[_burst, _hsize, _first] = \
+                    tuple(((_first + i) % _beats) << _hsize for i in range(1, _beats))
+
 class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, SimulationInterface, MemoryInterface):
     def __init__(self, length: int, bus_width: int, *, min_wait_states: int = 5,
                  max_wait_states: int = 25, secure_transfer: bool = False,
@@ -35,9 +57,9 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
         self.length: int = length
         self.bus_width: int = bus_width
         self.bus_byte_width: int = bus_byte_width
-        self.mem: Dict[int, int] = {}
-        self.resp: SRESP = SRESP(*self._reset_value)
-        self.old_resp: SRESP = SRESP(*self._reset_value)
+        self.mem: bytearray = bytearray(length)
+        self.resp: SRESP = self._reset_value
+        self.old_resp: SRESP = self._reset_value
         self.wait_cycles: int  = 0
         self.min_wait_cycles: int = min_wait_states
         self.max_wait_cycles: int = max_wait_states
@@ -45,6 +67,8 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
         self.eval_done: Event = Event()
         self.log = SimLog(f"cocotb.subordinate.{name}")
         self.random_gen = default_rng()
+        # pregenerated wait states, one buffer per distribution mean
+        self._poisson_bufs: Dict[float, List[int]] = {}
 
         self.wdata: int = 0
         self.process_wdata_next_cycle: bool = False
@@ -54,6 +78,7 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
         if burst:
             self.bursting: bool = False
             self.bursting_address: List[int]
+            self._burst_idx: int = 0
             self.incr_burst: bool
             self.burst_size: HSIZE
             self.burst_type: HBURST
@@ -67,12 +92,19 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
         self.exclusive_transfers = exclusive_transfers
         if exclusive_transfers:
-            self.watched_addresses: Set[int] = set()
-            self.transaction_set: Set[Tuple[int, HSIZE, HPROT, HBURST, int, HNONSEC]] = set() # transactions
-            self.failed_transaction_set: Set[Tuple[int, HSIZE, HPROT, HBURST, int, HNONSEC]] = set() # failed transactions
+            # one bit per memory byte, set while an exclusive read watches it
+            self.watched_bits: bytearray = bytearray((length + 7) // 8)
+            self.watching_transactions: Dict[int, Set[int]] = {}
+            # transactions are identified by ints packed in trans_id()
+            self.transaction_set: Set[int] = set() # transactions
+            self.failed_transaction_set: Set[int] = set() # failed transactions
+            self.master_shift: int = 14 + length.bit_length()
             self.no_collision: bool = True
 
         self.write_strobe = write_strobe
+        if not (burst or secure_transfer or exclusive_transfers) and \
+           type(self).process is SimMem1PSubordinate.process:
+            self.process = self._process_plain # type: ignore
 
         self.command: ICMD = ICMD()
         self.input: ICMD = ICMD()
@@ -80,17 +112,12 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
 
     def init_memory(self, init_array: List[int], start_address: int) -> None:
-        for i, data in enumerate(init_array):
-            self.mem[start_address+i] = data
+        assert 0 <= start_address and start_address + len(init_array) <= self.length, \
+            "Initialized area exceeds memory"
+        self.mem[start_address:start_address+len(init_array)] = bytes(init_array)
 
     def memory_dump(self) -> List[int]:
-        ret = []
-        for i in range(self.length):
-            if i in self.mem:
-                ret.append(self.mem[i])
-            else:
-                ret.append(0)
-        return ret
+        return list(self.mem)
 
 
     def register_clock(self: T, clock: SimHandleBase) -> T:
@@ -113,24 +140,16 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
 
     def get_rsp(self) -> SRESP:
-        return SRESP(*self.resp)
+        return self.resp
 
     def _check_fix_incr(self, hAddr: int, hBurst: HBURST, hSize: HSIZE) -> None:
-        _first: int = hAddr // 1024
-        _last: int
-        if hBurst == HBURST.Incr4:
-            _last = hAddr + 4 * 2**hSize
-        elif hBurst == HBURST.Incr4:
-            _last = hAddr + 8 * 2**hSize
-        else:
-            _last = hAddr + 16 * 2**hSize
-        _last //= 1024
-        if _first != _last:
+        # compare the 1KB pages of the first and the last byte of the burst
+        if hAddr >> 10 != (hAddr + (_BURST_BEATS[hBurst] << hSize) - 1) >> 10:
             raise Exception("Incrementing burst crosses 1KB boundry")
 
     def _check_not_bursting(self, hAddr: int, hBurst: HBURST, hSize: HSIZE,
                             hTrans: HTRANS, hWrite: HWRITE, hProt: HPROT) -> None:
-        if hBurst in [HBURST.Incr4, HBURST.Incr8, HBURST.Incr16]:
+        if hBurst in _INCR_BURSTS:
             self._check_fix_incr(hAddr, hBurst, hSize)
         if hBurst != HBURST.Single:
             self.bursting = True
@@ -140,19 +159,17 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
             self.burst_type = hBurst
             self.burst_write = hWrite
             self.burst_prot = hProt
+            self._burst_idx = 0
             if hBurst != HBURST.Incr:
-                _incr = hBurst in [HBURST.Incr4, HBURST.Incr8, HBURST.Incr16]
-                _size = {HBURST.Incr4 : 4, HBURST.Wrap4 : 4,
-                         HBURST.Incr8 : 8, HBURST.Wrap8 : 8,
-                         HBURST.Incr16 : 16, HBURST.Wrap16 : 16}[hBurst]
-                if _incr:
-                    self.bursting_addresses = [hAddr + i * 2**hSize for i in range(_size)]
+                if hBurst in _INCR_BURSTS:
+                    _base_addr = hAddr
+                    _first = 0
                 else:
-                    _mod = (_size * 2**hSize)
+                    _mod = _BURST_BEATS[hBurst] << hSize
                     _base_addr = hAddr & ~(_mod - 1)
-                    _offset = hAddr % _mod
-                    self.bursting_addresses = [_base_addr + (_offset + i * 2**hSize) % _mod for i in range(_size)]
-                self.bursting_addresses = self.bursting_addresses[1:]
+                    _first = (hAddr & (_mod - 1)) >> hSize
+                self.bursting_addresses = [_base_addr + offset for offset in
+                                           _BURST_OFFSETS[hBurst, hSize, _first]]
             else:
                 self.incr_burst = True
                 self.bursting_addresses = [hAddr + 2**hSize]
@@ -171,7 +188,8 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
                 self.bursting = False
                 self.burst_check(hAddr, hBurst, hSize, hTrans, hWrite, hProt)
                 return
-            if len(self.bursting_addresses) != 0 and hAddr != self.bursting_addresses[0]:
+            if self._burst_idx < len(self.bursting_addresses) and \
+               hAddr != self.bursting_addresses[self._burst_idx]:
                 raise Exception(f"Incorrect burst address:{hAddr}")
             if hSize != self.burst_size:
                 raise Exception(f"Incorrect burst size, got: {hSize} expected: {self.burst_size}")
@@ -185,8 +203,8 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
                 if self.incr_burst:
                     self.bursting_addresses[0] = hAddr + 2 ** hSize
                 else:
-                    self.bursting_addresses = self.bursting_addresses[1:]
-                    if len(self.bursting_addresses) == 0:
+                    self._burst_idx += 1
+                    if self._burst_idx == len(self.bursting_addresses):
                         self.bursting = False
         elif hTrans in [HTRANS.Seq, HTRANS.Busy]:
             raise Exception(f"{hTrans.__str__()} in no burst context")
@@ -195,8 +213,6 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
     def exclusive_check(self, hAddr: int, hSize: HSIZE, hProt: HPROT,
                         hBurst: HBURST, hMaster: int, hNonsec: HNONSEC,
                         hExcl: HEXCL, hTrans: HTRANS, hWrite: HWRITE) -> None:
-
-        _trans_id = (hAddr, hSize, hProt, hBurst, hMaster, hNonsec)
         if hExcl == HEXCL.Excl:
             if self.burst and hBurst not in [HBURST.Single, HBURST.Incr]:
                 raise Exception("Exclusive transfer must be single beat")
@@ -204,37 +220,28 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
                 raise Exception("Exclusive transfer cannot have BUSY command, "
                                 "use IDLE as it is not considered part of exclusive transfer")
             if hWrite == HWRITE.Read:
-                if _trans_id in self.transaction_set:
+                if self.trans_id(hAddr, hSize, hProt, hBurst, hMaster, hNonsec) in self.transaction_set:
                     raise Exception("Exclusive read after exclusive read is not permited."
                                     "Exclusive read may be followed only by exclusive write.")
 
 
     def put_cmd(self, cmd: ICMD) -> None:
-        temp: Dict[Any, Any] = {}
-        temp["hAddr"] = cmd.hAddr
-        temp["hSize"] = cmd.hSize
-        temp["hTrans"] = cmd.hTrans
-        temp["hWrite"] = cmd.hWrite
-        temp["hSel"] = cmd.hSel
-        temp["hProt"] = cmd.hProt
-
-        if self.burst:
-            temp["hBurst"] = cmd.hBurst
-        if self.secure_transfer:
-            temp["hNonsec"] = cmd.hNonsec
-        if self.exclusive_transfers:
-            temp["hExcl"] = cmd.hExcl
-            temp["hMaster"] = cmd.hMaster
-        if self.write_strobe:
-            temp["hWstrb"] = cmd.hWstrb
-
-        self.input = ICMD(**temp)
+        self.input = ICMD(cmd.hAddr,
+                          cmd.hBurst if self.burst else HBURST.Incr,
+                          HMASTLOCK.UnLocked, cmd.hProt, cmd.hSize,
+                          cmd.hNonsec if self.secure_transfer else HNONSEC.Secure,
+                          cmd.hExcl if self.exclusive_transfers else HEXCL.NonExcl,
+                          cmd.hMaster if self.exclusive_transfers else 0,
+                          cmd.hTrans,
+                          cmd.hWstrb if self.write_strobe else 0,
+                          cmd.hWrite, cmd.hSel)
 
         if not self.is_ready():
             return
-        temp['hAddr'] %= self.length
-
-        self.command = ICMD(*self.input)
+        if cmd.hAddr < self.length:
+            self.command = self.input
+        else:
+            self.command = self.input._replace(hAddr=cmd.hAddr % self.length)
 
         if cmd.hSel == HSEL.Sel:
             if cmd.hAddr % 2**cmd.hSize != 0:
@@ -255,13 +262,12 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
     async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR(False)
-        await self.eval_done.wait()
+        self._monitoring = True
+        if not self.eval_done.is_set():
+            await self.eval_done.wait()
         self.eval_done.clear()
-        for signal, value in zip(self.input._fields, self.input):
-            monit.command[signal] = value
-
-        for signal, value in zip(self.old_resp._fields, self.old_resp):
-            monit.resp[signal] = value
+        monit.command = self.input._asdict()
+        monit.resp = self.old_resp._asdict()
 
         monit.wdata = self.wdata
         monit.ready = self.is_ready()
@@ -274,110 +280,171 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
     def do_reset(self) -> None:
         self.error = False
-        self.mem = {}
+        self.mem = bytearray(self.length)
         self.wait_cycles = 0
         if self.exclusive_transfers:
-            self.watched_addresses.clear()
+            self.watched_bits = bytearray((self.length + 7) // 8)
+            self.watching_transactions.clear()
             self.transaction_set.clear()
             self.no_collision = True
-        self.resp = SRESP(*self._reset_value)
+        self.resp = self._reset_value
 
 
     def process_secure_transfer(self) -> None:
         if self.secure_transfer:
-            if self.command.hTrans not in [HTRANS.Idle, HTRANS.Busy] and self.command.hNonsec == HNONSEC.NonSecure:
+            if self.command.hTrans not in _IDLE_BUSY and self.command.hNonsec == HNONSEC.NonSecure:
                 if self.command.hWrite == HWRITE.Read and not self.nonsec_read:
                     self.error = True
                 elif self.command.hWrite == HWRITE.Write and not self.nonsec_write:
                     self.error = True
 
 
+    # hNonsec:1 | hBurst:3 | hProt:7 | hSize:3 | hAddr | hMaster
+    def trans_id(self, hAddr: int, hSize: HSIZE, hProt: HPROT, hBurst: HBURST,
+                 hMaster: int, hNonsec: HNONSEC) -> int:
+        return (hNonsec | hBurst << 1 | hProt_to_int(hProt) << 4 | hSize << 11 |
+                hAddr << 14 | hMaster << self.master_shift)
+
+
     def process_exclusive_transfer(self) -> None:
         if self.exclusive_transfers:
             self.no_colision = True
             if self.command.hExcl == HEXCL.Excl:
-                _trans_id = (self.command.hAddr, self.command.hSize, self.command.hProt,
-                             self.command.hBurst if self.burst else HBURST.Single,
-                             self.command.hMaster, self.command.hNonsec)
+                _trans_id = self.trans_id(self.command.hAddr, self.command.hSize, self.command.hProt,
+                                          self.command.hBurst if self.burst else HBURST.Single,
+                                          self.command.hMaster, self.command.hNonsec)
                 if self.command.hWrite == HWRITE.Read:
                     self.transaction_set.add(_trans_id)
                     _addr = self.command.hAddr
-                    for addr in range(_addr, _addr + 2**self.command.hSize):
-                        self.watched_addresses.add(addr)
+                    _size = 2**self.command.hSize
+                    self.watch_addresses(_addr, _size)
+                    for addr in range(_addr, _addr + _size):
+                        self.watching_transactions.setdefault(addr, set()).add(_trans_id)
                     self.temp["hExOkay"] = HEXOKAY.Successful
                 if self.command.hWrite == HWRITE.Write:
                     if _trans_id not in self.transaction_set or \
                        _trans_id in self.failed_transaction_set:
-                        self.failed_transaction_set -= set([_trans_id])
+                        self.failed_transaction_set.discard(_trans_id)
                         self.no_collision = False
                     else:
                         self.temp["hExOkay"] = HEXOKAY.Successful
 
 
+    def watch_addresses(self, _addr: int, _size: int) -> None:
+        if _size >= 8:
+            self.watched_bits[_addr >> 3:(_addr + _size) >> 3] = b"\xff" * (_size >> 3)
+        else:
+            self.watched_bits[_addr >> 3] |= ((1 << _size) - 1) << (_addr & 7)
+
+
+    def is_watched(self, _addr: int, _size: int) -> bool:
+        if _size >= 8:
+            return any(self.watched_bits[_addr >> 3:(_addr + _size) >> 3])
+        return bool(self.watched_bits[_addr >> 3] & ((1 << _size) - 1) << (_addr & 7))
+
+
     def exclusive_trans_colision_check(self, _addr: int) -> bool:
         return self.no_collision
 
 
     def exclusive_trans_colision_update(self, _addr: int) -> None:
-        rm = set()
-        self.watched_addresses.remove(_addr)
-        for _trans_id in self.transaction_set:
-            (addr, size, *rest) = _trans_id
-            if _addr in range(addr, addr + 2**size):
-                self.failed_transaction_set.add(_trans_id)
-                rm.add(_trans_id)
-        for _trans_id in rm:
-            self.transaction_set.remove(_trans_id)
+        self.watched_bits[_addr >> 3] &= ~(1 << (_addr & 7))
+        _failed = self.watching_transactions.pop(_addr, None)
+        if _failed:
+            _failed &= self.transaction_set
+            self.transaction_set -= _failed
+            self.failed_transaction_set |= _failed
 
 
     def process_write(self) -> None:
         self.process_wdata_next_cycle = False
-        _offset = self.wcommand.hAddr % self.bus_byte_width
-        _modify = True
-        for i in range(2**self.wcommand.hSize):
-            _addr = i + self.wcommand.hAddr
-            if self.exclusive_transfers:
-                _modify = self.exclusive_trans_colision_check(_addr)
-                if _addr in self.watched_addresses:
-                    self.exclusive_trans_colision_update(_addr)
-            if _modify:
-                _mask = 2**8 -1
-                if self.write_strobe:
-                    _mask *= int(bool(self.wcommand.hWstrb & (1 << i +_offset)))
-                if _addr not in self.mem or _mask != 0:
-                    self.mem[_addr] = ((self.wdata >> 8 * (i + _offset)) & _mask)
+        _addr = self.wcommand.hAddr
+        _size = 2**self.wcommand.hSize
+        _offset = _addr % self.bus_byte_width
+        if self.exclusive_transfers:
+            if self.is_watched(_addr, _size):
+                for addr in range(_addr, _addr + _size):
+                    if self.watched_bits[addr >> 3] >> (addr & 7) & 1:
+                        self.exclusive_trans_colision_update(addr)
+            if not self.exclusive_trans_colision_check(_addr):
+                return
+        _data = (self.wdata >> 8 * _offset) & ((1 << 8 * _size) - 1)
+        if self.write_strobe:
+            # only partially strobed words need a read-modify-write
+            _strb = (self.wcommand.hWstrb >> _offset) & ((1 << _size) - 1)
+            if _strb == 0:
+                return
+            if _strb != (1 << _size) - 1:
+                _mask = int.from_bytes(b"".join(_STROBE_BYTES[strb] for strb in
+                                                _strb.to_bytes((_size + 7) // 8, "little")),
+                                       "little")
+                _old = int.from_bytes(self.mem[_addr:_addr + _size], "little")
+                _data = (_old & ~_mask) | (_data & _mask)
+        self.mem[_addr:_addr + _size] = _data.to_bytes(_size, "little")
+
+
+    def _next_poisson(self, lam: float) -> int:
+        buf = self._poisson_bufs.get(lam)
+        if not buf:
+            buf = self._poisson_bufs[lam] = self.random_gen.poisson(lam, _POISSON_BATCH).tolist()
+        return buf.pop()
 
 
     def process(self) -> None:
         self.error = False
-        avr = (self.max_wait_cycles + self.min_wait_cycles) / 2
-        self.wait_cycles = min(self.random_gen.poisson(avr), self.max_wait_cycles)
-        self.temp["hRData"] = 0
-        self.temp["hResp"] = HRESP.Successful
-        self.temp["hReadyOut"] = HREADYOUT.NotReady
+        temp = self.temp
+        temp["hRData"] = 0
+        temp["hResp"] = HRESP.Successful
+        temp["hReadyOut"] = HREADYOUT.NotReady
         if self.exclusive_transfers:
-            self.temp["hExOkay"] = HEXOKAY.Failed
-        self.process_secure_transfer()
-        if self.error:
-            return
-        self.process_exclusive_transfer()
-        if self.command.hTrans in [HTRANS.Idle, HTRANS.Busy]:
+            temp["hExOkay"] = HEXOKAY.Failed
+        if self.secure_transfer:
+            self.process_secure_transfer()
+            if self.error:
+                return
+        if self.exclusive_transfers:
+            self.process_exclusive_transfer()
+        hTrans = self.command.hTrans
+        if hTrans in _IDLE_BUSY:
             self.wait_cycles = 0
-        elif self.burst and self.command.hTrans == HTRANS.Seq:
-            self.wait_cycles = min(self.random_gen.poisson(self.min_wait_cycles),
+        elif self.burst and hTrans == HTRANS.Seq:
+            self.wait_cycles = min(self._next_poisson(self.min_wait_cycles),
+                                   self.max_wait_cycles)
+        else:
+            self.wait_cycles = min(self._next_poisson((self.max_wait_cycles + self.min_wait_cycles) / 2),
+                                   self.max_wait_cycles)
+
+
+    # process() for a subordinate without burst, secure or exclusive support
+    def _process_plain(self) -> None:
+        self.error = False
+        temp = self.temp
+        temp["hRData"] = 0
+        temp["hResp"] = HRESP.Successful
+        temp["hReadyOut"] = HREADYOUT.NotReady
+        if self.command.hTrans in _IDLE_BUSY:
+            self.wait_cycles = 0
+        else:
+            self.wait_cycles = min(self._next_poisson((self.max_wait_cycles + self.min_wait_cycles) / 2),
                                    self.max_wait_cycles)
 
 
     async def start(self) -> None:
         clock_edge = RisingEdge(self.clock)
         readonly = ReadOnly()
+        temp = self.temp
+        is_reset = self.is_reset
+        is_ready = self.is_ready
+        eval_done = self.eval_done
+        bus_byte_width = self.bus_byte_width
         while True:
-            self.temp["hRData"] = 0
+            temp["hRData"] = 0
             await readonly
-            self.old_resp = copy(self.resp)
-            if self.is_reset():
+            self.old_resp = self.resp
+            reset = is_reset()
+            if reset:
                 self.do_reset()
-            elif self.is_ready() and self.command.hSel == HSEL.Sel:
+            elif is_ready() and self.command.hSel == HSEL.Sel:
                 if self.process_wdata_next_cycle:
                     self.process_write()
 
@@ -385,25 +452,26 @@ class SimMem1PSubordinate(SubordinateInterface, MonitorableInterface, Simulation
 
                 if self.error:
                     self.wait_cycles = 1
-                    self.temp["hRData"] = 0
-                    self.temp["hResp"] = HRESP.Failed
-
-            if not self.is_reset() and self.wait_cycles == 0 and not self.error and \
-                self.command.hTrans not in [HTRANS.Idle, HTRANS.Busy]: # update state and prepare response
-                    if self.command.hWrite == HWRITE.Read:
-                        _offset = self.command.hAddr % self.bus_byte_width
-                        for i in range(2**self.command.hSize):
-                            _addr = i + self.command.hAddr
-                            _data = self.mem[_addr] if _addr in self.mem else 0
-                            self.temp["hRData"] |= _data << 8*(i + _offset)
+                    temp["hRData"] = 0
+                    temp["hResp"] = HRESP.Failed
+
+            command = self.command
+            if not reset and self.wait_cycles == 0 and not self.error and \
+                command.hTrans not in _IDLE_BUSY: # update state and prepare response
+                    if command.hWrite == HWRITE.Read:
+                        _addr = command.hAddr
+                        _offset = _addr % bus_byte_width
+                        _data = int.from_bytes(self.mem[_addr:_addr + 2**command.hSize], "little")
+                        temp["hRData"] = _data << 8*_offset
                     else:
                         self.process_wdata_next_cycle = True
-                        self.wcommand = self.command
+                        self.wcommand = command
 
             if self.wait_cycles == 0: # mark response as avlid
-                self.temp["hReadyOut"] = HREADYOUT.Ready
+                temp["hReadyOut"] = HREADYOUT.Ready
 
-            self.resp = SRESP(**self.temp)
+            self.resp = SRESP(**temp)
             self.wait_cycles -= 1
-            self.eval_done.set()
+            if self._monitoring:
+                eval_done.set()
             await clock_edge
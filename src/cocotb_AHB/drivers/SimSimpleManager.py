@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List, Dict, Any, TypeVar, Tuple
+from functools import lru_cache
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly, ReadWrite, Event # type: ignore
@@ -12,6 +13,35 @@ from cocotb_AHB.AHB_common.ManagerInterface import ManagerInterface
 from cocotb_AHB.AHB_common.MonitorableInterface import MonitorableInterface
 
 T = TypeVar('T')
+# shared, NamedTuples are immutable
+_MDATA_ZERO: MDATA = MDATA(0)
+
+_MASK_DIGITS: bytes = b"0" + b"1" * 255
+
+# Splits a transfer into aligned beats of (hSize, distance from the first
+# address, offset on the bus). Only the address modulo bus width matters.
+# Writes let the first unaligned beats run past the end, strobes mask them.
+@lru_cache(maxsize=1024)
+def _decompose(bus_byte_width: int, address: int, length: int,
+               write: bool) -> Tuple[Tuple[HSIZE, int, int], ...]:
+    beats = []
+    start = address
+    end_address = address + length
+    bus_size = bus_byte_width.bit_length() - 1
+    for i in range(bus_size):
+        if (address & 2**i) and (address < end_address if write else
+                                 address + 2**i <= end_address):
+            beats.append((HSIZE(i), address - start, address % bus_byte_width))
+            address += 2**i
+    while address + bus_byte_width <= end_address:
+        beats.append((HSIZE(bus_size), address - start, 0))
+        address += bus_byte_width
+    for i in range(bus_size, -1, -1):
+        if address + 2**i <= end_address:
+            beats.append((HSIZE(i), address - start, address % bus_byte_width))
+            address += 2**i
+    assert address >= end_address
+    return tuple(beats)
 
 class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterface):
     def __init__(self, bus_width: int) -> None:
@@ -19,7 +49,8 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
         self.responses: List[IRESP] = []
         self.ready: HREADY
         self.eval_done: Event = Event()
-        self.send_command: MCMD = MCMD(*self._reset_value)
+        self.responded: Event = Event()
+        self.send_command: MCMD = self._reset_value
         self.resp: Dict[Any, Any] = {}
         self.new_cmd: bool = False
         self.valid_cmd: bool = False
@@ -51,13 +82,12 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
 
     async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR(False)
-        await self.eval_done.wait()
+        self._monitoring = True
+        if not self.eval_done.is_set():
+            await self.eval_done.wait()
         self.eval_done.clear()
-        for signal, value in zip(self.send_command._fields, self.send_command):
-            monit.command[signal] = value
-
-        for signal, value in self.resp.items():
-            monit.resp[signal] = value
+        monit.command = self.send_command._asdict()
+        monit.resp = dict(self.resp)
 
         monit.wdata = self.delayed.hWData
         monit.ready = self.is_ready()
@@ -76,8 +106,8 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
             self.to_be_delayed = self.commands[self.cnt][1]
             self.send_command = self.commands[self.cnt][0]
             return self.commands[self.cnt][0]
-        self.to_be_delayed = MDATA(0)
-        return MCMD()
+        self.to_be_delayed = _MDATA_ZERO
+        return self._reset_value
 
 
     def get_data(self) -> MDATA:
@@ -85,11 +115,10 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
 
 
     async def transfer_done(self) -> None:
-        ce = RisingEdge(self.clock)
-        while True:
-            if len(self.responses) == len(self.commands):
-                return
-            await ce
+        if len(self.responses) != len(self.commands):
+            self.responded.clear()
+            await self.responded.wait()
+            await RisingEdge(self.clock)
 
 
     def is_reset(self) -> bool:
@@ -103,154 +132,66 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
     async def start(self) -> None:
         clock_edge = RisingEdge(self.clock)
         readonly = ReadOnly()
+        is_reset = self.is_reset
+        is_ready = self.is_ready
+        eval_done = self.eval_done
         while True:
             await readonly
-            if self.is_reset():
+            reset = is_reset()
+            ready = is_ready()
+            if reset:
                 self.do_reset()
-            elif self.is_ready():
+            elif ready:
                 if self.cnt > 0:
                     self.responses.append(IRESP(**self.resp))
+                    if len(self.responses) == len(self.commands):
+                        self.responded.set()
                 if not self.new_cmd:
                     self.cnt += 1
 
-            self.valid_address_stage = False
-            if not self.is_reset() and self.is_ready():
-                self.valid_address_stage = True
-            self.eval_done.set()
+            self.valid_address_stage = not reset and ready
+            if self._monitoring:
+                eval_done.set()
             if self.valid_address_stage:
                 self.delayed = self.to_be_delayed
 
             await clock_edge
 
 
+    def _commit(self, cmds: List[Tuple[MCMD, MDATA]]) -> None:
+        assert len(cmds)>0
+        self.responses = []
+        self.cnt = 0
+        self.commands = cmds
+        self.new_cmd = True
+
+
     def read(self, address: int, length: int) -> None:
-        cmds = []
-        end_address = address + length
-        for i in range((self.bus_byte_width).bit_length() - 1):
-            if (address & 2**i) and address + 2**i <= end_address:
-                _offset = address % (self.bus_byte_width)
-                cmds.append((
-                        MCMD(hAddr=address, hSize=HSIZE(i), hTrans=HTRANS.NonSeq, hWrite=HWRITE.Read),
-                        MDATA(0)
-                    )
-                )
-                address += 2**i
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        while address+self.bus_byte_width <= end_address:
-            _size = (self.bus_byte_width).bit_length() - 1
-            cmds.append((
-                    MCMD(hAddr=address, hSize=HSIZE(i), hTrans=HTRANS.NonSeq, hWrite=HWRITE.Read),
-                    MDATA(0)
-                )
-            )
-            address += (self.bus_byte_width)
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        for i in range((self.bus_byte_width).bit_length()-1, -1, -1):
-            if address + 2**i <= end_address:
-                _offset = address % (self.bus_byte_width)
-                cmds.append((
-                        MCMD(hAddr=address, hSize=HSIZE(i), hTrans=HTRANS.NonSeq, hWrite=HWRITE.Read),
-                        MDATA(0)
-                    )
-                )
-                address += 2**i
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        assert False
+        bbw = self.bus_byte_width
+        cmds = [(MCMD(hAddr=address + delta, hSize=size, hTrans=HTRANS.NonSeq, hWrite=HWRITE.Read),
+                 _MDATA_ZERO)
+                for size, delta, _ in _decompose(bbw, address % bbw, length, False)]
+        self._commit(cmds)
 
 
     def write(self, address: int, length: int,
               value: List[int], byte_mask: List[bool]) -> None:
         assert length == len(value) and length == len(byte_mask)
+        bbw = self.bus_byte_width
         cmds = []
-        end_address = address + length
-        for i in range((self.bus_byte_width).bit_length() - 1):
-            if (address & 2**i) and len(value) != 0:
-                _mask = 0
-                _value = 0
-                _offset = address % (self.bus_byte_width)
-                for j in range(0, 2**i):
-                    if len(value) != 0:
-                        _mask |= byte_mask[0] << _offset + j
-                        _value |= value[0] << ((_offset + j) * 8)
-                        byte_mask = byte_mask[1:]
-                        value = value[1:]
-                cmds.append((
-                    MCMD(hAddr=address, hSize=HSIZE(i), hTrans=HTRANS.NonSeq,
-                         hWrite=HWRITE.Write, hWstrb=_mask),
-                    MDATA(_value)
-                ))
-                address += 2**i
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        while len(value) >= (self.bus_byte_width):
-            _mask = 0
-            _value = 0
-            _size = (self.bus_byte_width).bit_length() - 1
-            for j in range(0, (self.bus_byte_width)):
-                _mask |= byte_mask[0] << j
-                _value |= value[0] << (j * 8)
-                byte_mask = byte_mask[1:]
-                value = value[1:]
+        value_buf = bytes(value)
+        # byte mask as "0"/"1" digits, chunks of it are parsed with int(..., 2)
+        mask_buf = bytes(byte_mask).translate(_MASK_DIGITS)
+        for size, delta, _offset in _decompose(bbw, address % bbw, length, True):
+            _end = delta + 2**size
+            _mask = int(mask_buf[delta:_end][::-1], 2) << _offset
+            _value = int.from_bytes(value_buf[delta:_end], "little") << (_offset * 8)
             cmds.append((
-                MCMD(hAddr=address, hSize=HSIZE(_size), hTrans=HTRANS.NonSeq,
+                MCMD(hAddr=address + delta, hSize=size, hTrans=HTRANS.NonSeq,
                      hWrite=HWRITE.Write, hWstrb=_mask),
                 MDATA(_value)
             ))
-            address += (self.bus_byte_width)
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        for i in range((self.bus_byte_width).bit_length()-1, -1 , -1):
-            if len(value) & 2**i:
-                _mask = 0
-                _value = 0
-                _offset = address % (self.bus_byte_width)
-                for j in range(0, 2**i):
-                    _mask |= byte_mask[0] << _offset + j
-                    _value |= value[0] << ((_offset + j) * 8)
-                    byte_mask = byte_mask[1:]
-                    value = value[1:]
-                cmds.append((
-                    MCMD(hAddr=address, hSize=HSIZE(i), hTrans=HTRANS.NonSeq,
-                         hWrite=HWRITE.Write, hWstrb=_mask),
-                    MDATA(_value)
-                ))
-                address += 2**i
-        if address >= end_address:
-            self.responses = []
-            self.cnt = 0
-            self.commands = cmds
-            self.new_cmd = True
-            assert len(cmds)>0
-            return
-        assert False
+        self._commit(cmds)
 
 
     def get_rsp_success(self) -> List[bool]:
@@ -265,7 +206,7 @@ class SimSimpleManager(SimulationInterface, ManagerInterface, MonitorableInterfa
         addr = base_address
         for command, resp in zip(self.commands, self.responses):
             _offset = addr % bus_byte_width
-            for j in range(2**command[0].hSize):
-                ret.append((resp.hRData >> ((_offset + j)*8)) & 0xFF)
-            addr += 2**command[0].hSize
+            _size = 2**command[0].hSize
+            ret.extend(((resp.hRData >> (_offset * 8)) & ((1 << _size * 8) - 1)).to_bytes(_size, "little"))
+            addr += _size
         return ret
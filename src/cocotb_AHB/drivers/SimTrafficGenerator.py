@@ -1,11 +1,10 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from random import randint
+import random
 
-from typing import Any, Tuple, Dict, List, Set, TypeVar
+from typing import Any, Tuple, Dict, List, Set, TypeVar, Sequence, Callable
 from copy import copy
-from math import log2
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly, Event # type: ignore
@@ -16,6 +15,15 @@ from cocotb_AHB.AHB_common.MonitorableInterface import MonitorableInterface
 from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 
 T = TypeVar('T')
+_HPROT_DEFAULT: HPROT = HPROT()
+# Enum members indexed by their value, cheaper than calling the enum on a random int
+_HSIZES: Tuple[HSIZE, ...] = tuple(HSIZE)
+_HBURSTS: Tuple[HBURST, ...] = tuple(HBURST)
+_HWRITES: Tuple[HWRITE, ...] = (HWRITE.Read, HWRITE.Write)
+_HNONSECS: Tuple[HNONSEC, ...] = (HNONSEC.Secure, HNONSEC.NonSecure)
+# Beats per burst indexed by HBURST, -1 for undefined length Incr
+_BURST_SIZE: Tuple[int, ...] = (0, -1, 4, 4, 8, 8, 16, 16)
+_WRAP_BURSTS: Tuple[HBURST, ...] = (HBURST.Wrap4, HBURST.Wrap8, HBURST.Wrap16)
 
 class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInterface):
     def __init__(self, addr_width: int, bus_width: int, *, secure_transfer: bool = False,
@@ -33,18 +41,28 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
         self.addr_width: int = addr_width
         self.bus_width: int = bus_width
         self.bus_byte_width: int = bus_byte_width
-        self.max_size: int = int(log2(bus_byte_width))
-        self.command: MCMD = MCMD(*self._reset_value)
-        self.old_command: MCMD = MCMD(*self._reset_value)
+        self.max_size: int = bus_byte_width.bit_length() - 1
+        self.command: MCMD = self._reset_value
+        self.old_command: MCMD = self._reset_value
         self.eval_done: Event = Event()
         self.resp: Dict[Any, Any] = {}
         self.valid_cmd: bool = False
         self.master_id = master_id
+        # private generator seeded from the global one, so random.seed()
+        # still reproduces the traffic
+        self.random_gen: random.Random = random.Random(random.getrandbits(64))
+        self.wstrb_mask: int = 2**bus_byte_width - 1
 
         self.secure_transfer: bool = secure_transfer
         if secure_transfer:
             self.nonsec_read: bool = nonsec_read
             self.nonsec_write: bool = nonsec_write
+        # the flags are fixed at construction, resolve them once for the do_* methods:
+        # whether HNONSEC is randomized, indexed by HWRITE
+        self.random_nonsec: Tuple[bool, bool] = (secure_transfer and nonsec_read,
+                                                 secure_transfer and nonsec_write)
+        self.idle_nonsec: HNONSEC = HNONSEC.NonSecure if secure_transfer else HNONSEC.Secure
+        self.single_burst: HBURST = HBURST.Single if burst else HBURST.Incr
 
         self.exclusive_transfers: bool = exclusive_transfers
         if exclusive_transfers:
@@ -53,15 +71,28 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
             self.exclusive_id: Tuple[int, HSIZE, HBURST, HNONSEC, int]
 
         self.burst: bool = burst
+        self.bursting: bool = False
         if burst:
-            self.bursting: bool = False
-            self.burst_addresses: List[int] = []
+            # ranges for incrementing bursts, lists for wrapping ones
+            self.burst_addresses: Sequence[int] = []
+            self._burst_idx: int = 0
             self.burst_type: HBURST = HBURST.Incr
             self.burst_sec: HNONSEC
             self.burst_rw: HWRITE
             self.burst_size: HSIZE
 
         self.write_strobe = write_strobe
+
+        # transfer kind picked by do_something, indexed by 7 random bits:
+        # ~1% exclusive, ~24% bursts, the rest single transfers
+        self.dispatch: List[Callable[[], None]] = [self.do_single] * 128
+        _first_burst = 0
+        if exclusive_transfers:
+            self.dispatch[0] = self.do_exclusive_transfer
+            _first_burst = 1
+        if burst:
+            self.dispatch[_first_burst:_first_burst + 31] = [self.do_burst] * 31
+
         self.to_be_delayed: MDATA = MDATA(0)
         self.delayed: MDATA = MDATA(0)
         self.valid_address_stage: bool = False
@@ -83,7 +114,7 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
 
 
     def get_cmd(self) -> MCMD:
-        return MCMD(*self.command)
+        return self.command
 
 
     def get_data(self) -> MDATA:
@@ -103,14 +134,12 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
 
     async def monitor_get_status(self) -> HMONITOR:
         monit = HMONITOR(False)
-        await self.eval_done.wait()
+        self._monitoring = True
+        if not self.eval_done.is_set():
+            await self.eval_done.wait()
         self.eval_done.clear()
-        for signal, value in zip(self.old_command._fields, self.old_command):
-            monit.command[signal] = value
-
-        for signal, value in self.resp.items():
-            monit.resp[signal] = value
-
+        monit.command = self.old_command._asdict()
+        monit.resp = dict(self.resp)
         monit.wdata = self.delayed.hWData
         monit.ready = self.is_ready()
         return monit
@@ -121,126 +150,86 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
 
 
     def do_reset(self) -> None:
-        self.command = MCMD(*self._reset_value)
+        self.command = self._reset_value
 
 
     def do_nothing(self) -> None:
         self.valid_cmd = False
-        temp: Dict[Any, Any] = {}
-        if self.burst and self.bursting:
-            temp["hTrans"] = HTRANS.Busy
-            temp["hAddr"] = self.burst_addresses[0]
-            temp["hBurst"] = self.burst_type
-            temp["hSize"] = self.burst_size
-            if self.exclusive_transfers:
-                temp["hExcl"] = HEXCL.NonExcl
-            temp["hMaster"] = self.master_id
-            if self.secure_transfer:
-                temp["hNonsec"] = self.burst_sec
-            if self.write_strobe:
-                temp["hWstrb"] = 0
-            temp["hWrite"] = self.burst_rw
+        if self.bursting:
+            self.command = MCMD(self.burst_addresses[self._burst_idx], self.burst_type, HMASTLOCK.UnLocked,
+                                _HPROT_DEFAULT, self.burst_size, self.burst_sec, HEXCL.NonExcl,
+                                self.master_id, HTRANS.Busy, 0, self.burst_rw)
         else:
-            temp["hTrans"] = HTRANS.Idle
-            size = HSIZE(randint(0, self.max_size))
-            temp["hAddr"] = randint(0, 2**(self.addr_width - size) - 1) << size
-            temp["hBurst"] = HBURST.Incr
-            temp["hSize"] = size
-            if self.exclusive_transfers:
-                temp["hExcl"] = HEXCL.NonExcl
-            temp["hMaster"] = self.master_id
-            if self.secure_transfer:
-                temp["hNonsec"] = HNONSEC.NonSecure
-            if self.write_strobe:
-                temp["hWstrb"] = 0
-            temp["hWrite"] = HWRITE(randint(0,1))
+            size = _HSIZES[self.random_gen.randint(0, self.max_size)]
+            addr = self.random_gen.getrandbits(self.addr_width - size) << size
+            self.command = MCMD(addr, HBURST.Incr, HMASTLOCK.UnLocked, _HPROT_DEFAULT, size,
+                                self.idle_nonsec,
+                                HEXCL.NonExcl, self.master_id, HTRANS.Idle, 0,
+                                _HWRITES[self.random_gen.getrandbits(1)])
         self.to_be_delayed = MDATA(0)
-        self.command = MCMD(**temp)
 
 
     def do_single(self) -> None:
-        size = HSIZE(randint(0, self.max_size))
-        rw = HWRITE(randint(0,1))
-        temp: Dict[Any, Any] = {}
-
-        temp["hAddr"] = randint(0, 2**(self.addr_width - size) - 1) << size
-        temp["hBurst"] = HBURST.Single if self.burst else HBURST.Incr
-        temp["hSize"] = size
-        temp["hExcl"] = HEXCL.NonExcl
-        temp["hMaster"] = self.master_id
-        temp["hTrans"] = HTRANS.NonSeq
-        temp["hWstrb"] = 0
+        getrandbits = self.random_gen.getrandbits
+        size = _HSIZES[self.random_gen.randint(0, self.max_size)]
+        rw = _HWRITES[getrandbits(1)]
+        addr = getrandbits(self.addr_width - size) << size
+        wstrb = 0
         if rw == HWRITE.Write:
-            temp["hWstrb"] = randint(0, 2**self.bus_byte_width-1) if self.write_strobe else 2**self.bus_byte_width - 1
-        temp["hWrite"] = rw
-        temp["hNonsec"] = HNONSEC.Secure
-        if self.secure_transfer:
-            if self.nonsec_write and rw == HWRITE.Write:
-                temp["hNonsec"] = HNONSEC(randint(0,1))
-            if self.nonsec_read and rw == HWRITE.Read:
-                temp["hNonsec"] = HNONSEC(randint(0,1))
+            wstrb = getrandbits(self.bus_byte_width) if self.write_strobe else self.wstrb_mask
+        nonsec = _HNONSECS[getrandbits(1)] if self.random_nonsec[rw] else HNONSEC.Secure
 
         self.to_be_delayed = MDATA(0)
         if rw == HWRITE.Write:
-            self.to_be_delayed = MDATA(randint(0, 2**self.bus_byte_width-1))
+            self.to_be_delayed = MDATA(getrandbits(self.bus_byte_width))
 
-        self.command = MCMD(**temp)
+        self.command = MCMD(addr, self.single_burst, HMASTLOCK.UnLocked, _HPROT_DEFAULT, size,
+                            nonsec, HEXCL.NonExcl, self.master_id, HTRANS.NonSeq, wstrb, rw)
 
 
     def do_bursting(self, NonSeq: bool = False) -> None:
-        temp: Dict[Any, Any] = {}
-        temp["hAddr"] = self.burst_addresses[0]
-        self.burst_addresses = self.burst_addresses[1:]
-        if len(self.burst_addresses) == 0:
+        addr = self.burst_addresses[self._burst_idx]
+        self._burst_idx += 1
+        if self._burst_idx == len(self.burst_addresses):
             self.bursting = False
-        temp["hBurst"] = self.burst_type
-        temp["hSize"] = self.burst_size
-        temp["hExcl"] = HEXCL.NonExcl
-        temp["hMaster"] = self.master_id
-        temp["hTrans"] = HTRANS.Seq if not NonSeq else HTRANS.NonSeq
-        temp["hWstrb"] = 0
+        wstrb = 0
         if self.burst_rw == HWRITE.Write:
-            temp["hWstrb"] = randint(0, 2**self.bus_byte_width-1) if self.write_strobe else 2**self.bus_byte_width - 1
-        temp["hWrite"] = self.burst_rw
-        temp["hNonsec"] = self.burst_sec
+            wstrb = self.random_gen.getrandbits(self.bus_byte_width) if self.write_strobe else self.wstrb_mask
         self.to_be_delayed = MDATA(0)
         if self.burst_rw == HWRITE.Write:
-            self.to_be_delayed = MDATA(randint(0, 2**self.bus_byte_width-1))
-        self.command = MCMD(**temp)
+            self.to_be_delayed = MDATA(self.random_gen.getrandbits(self.bus_byte_width))
+        self.command = MCMD(addr, self.burst_type, HMASTLOCK.UnLocked, _HPROT_DEFAULT,
+                            self.burst_size, self.burst_sec, HEXCL.NonExcl, self.master_id,
+                            HTRANS.Seq if not NonSeq else HTRANS.NonSeq, wstrb, self.burst_rw)
 
 
     def do_burst(self) -> None:
-        size = HSIZE(randint(0, self.max_size))
-        addr = randint(0, 2**(self.addr_width - size) - 1) << size
-        burst_type = HBURST(randint(1, 7))
-        _size = {HBURST.Incr: -1,
-                 HBURST.Incr4 : 4, HBURST.Wrap4 : 4,
-                 HBURST.Incr8 : 8, HBURST.Wrap8 : 8,
-                 HBURST.Incr16 : 16, HBURST.Wrap16 : 16}[burst_type]
+        randint = self.random_gen.randint
+        getrandbits = self.random_gen.getrandbits
+        size = _HSIZES[randint(0, self.max_size)]
+        addr = getrandbits(self.addr_width - size) << size
+        burst_type = _HBURSTS[randint(1, 7)]
+        _size = _BURST_SIZE[burst_type]
+        _step = 1 << size
         if burst_type == HBURST.Incr:
-            length = randint(1, int((1024 - (addr % 1024)) / 2**size))
-            for i in range(0, length):
-                self.burst_addresses.append(addr + i*2**size)
-        elif burst_type in [HBURST.Wrap4, HBURST.Wrap8, HBURST.Wrap16]:
-            _mod = (_size * 2**size)
+            length = randint(1, (1024 - (addr & 1023)) >> size)
+            self.burst_addresses = range(addr, addr + length * _step, _step)
+        elif burst_type in _WRAP_BURSTS:
+            _mod = _size << size
             _base_addr = addr & ~(_mod - 1)
-            _offset = addr % _mod
-            self.burst_addresses = [_base_addr + (_offset + i * 2**size) % _mod for i in range(_size)]
+            self.burst_addresses = [*range(addr, _base_addr + _mod, _step),
+                                    *range(_base_addr, addr, _step)]
         else:
-            while (addr + _size * 2**size) // 1024 != addr // 1024:
-                addr = randint(0, 2**(self.addr_width - size) - 1) << size
-            self.burst_addresses = [addr + i * 2**size for i in range(_size)]
+            while (addr + (_size << size)) >> 10 != addr >> 10:
+                addr = getrandbits(self.addr_width - size) << size
+            self.burst_addresses = range(addr, addr + (_size << size), _step)
+        self._burst_idx = 0
         self.bursting = True
         self.burst_type = burst_type
         self.burst_size = size
-        rw = HWRITE(randint(0,1))
+        rw = _HWRITES[getrandbits(1)]
         self.burst_rw = rw
-        self.burst_sec = HNONSEC.Secure
-        if self.secure_transfer:
-            if self.nonsec_write and rw == HWRITE.Write:
-                self.burst_sec = HNONSEC(randint(0,1))
-            if self.nonsec_read and rw == HWRITE.Read:
-                self.burst_sec = HNONSEC(randint(0,1))
+        self.burst_sec = _HNONSECS[getrandbits(1)] if self.random_nonsec[rw] else HNONSEC.Secure
         self.do_bursting(True)
 
 
@@ -250,55 +239,35 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
         if not self.exclusive_trans:
             rw = HWRITE.Read
             sec = HNONSEC.Secure
-            if self.secure_transfer:
-                if self.nonsec_read and rw == HWRITE.Read:
-                    sec = HNONSEC(randint(0,1))
-            size = HSIZE(randint(0, self.max_size))
-            addr = randint(0, 2**(self.addr_width - size) - 1) << size
+            if self.random_nonsec[HWRITE.Read]:
+                sec = _HNONSECS[self.random_gen.getrandbits(1)]
+            size = _HSIZES[self.random_gen.randint(0, self.max_size)]
+            addr = self.random_gen.getrandbits(self.addr_width - size) << size
             burst_type = HBURST.Incr
             if self.burst:
-                burst_type = HBURST(randint(0, 1))
+                burst_type = _HBURSTS[self.random_gen.getrandbits(1)]
             self.exclusive_id = (addr, size, burst_type, sec, self.master_id)
             self.exclusive_trans = True
         else:
-            data = randint(0, 2**self.exclusive_id[1]-1)
+            data = self.random_gen.getrandbits(self.exclusive_id[1])
             _offset = self.exclusive_id[0] % self.bus_byte_width
             data <<= 8*_offset
 
         self.exclusive_transfer_pending = True
-        temp: Dict[Any, Any] = {}
-        temp["hAddr"] = self.exclusive_id[0]
-        temp["hBurst"] = self.exclusive_id[2]
-        temp["hSize"] = self.exclusive_id[1]
-        temp["hExcl"] = HEXCL.Excl
-        temp["hMaster"] = self.exclusive_id[4]
-        temp["hTrans"] = HTRANS.NonSeq
         self.to_be_delayed = MDATA(data)
-        temp["hWstrb"] = 2**self.bus_byte_width - 1
-        temp["hWrite"] = rw
-        temp["hNonsec"] = self.exclusive_id[3]
         if rw == HWRITE.Write:
             self.exclusive_trans = False
-        self.command = MCMD(**temp)
+        addr, size, burst_type, sec, master = self.exclusive_id
+        self.command = MCMD(addr, burst_type, HMASTLOCK.UnLocked, _HPROT_DEFAULT, size, sec,
+                            HEXCL.Excl, master, HTRANS.NonSeq, self.wstrb_mask, rw)
 
 
     def do_something(self) -> None:
         self.valid_cmd = True
-        if self.burst and self.bursting:
+        if self.bursting:
             self.do_bursting()
             return
-        rand = randint(0,99)
-        if self.exclusive_transfers:
-            if rand == 0:
-                self.do_exclusive_transfer()
-            elif self.burst and rand in range(1,25):
-                self.do_burst()
-            else:
-                self.do_single()
-        elif self.burst and rand in range(0, 24):
-            self.do_burst()
-        else:
-            self.do_single()
+        self.dispatch[self.random_gen.getrandbits(7)]()
 
 
     async def start(self) -> None:
@@ -306,22 +275,25 @@ class SimTrafficGenerator(ManagerInterface, MonitorableInterface, SimulationInte
         readonly = ReadOnly()
         while True:
             await readonly
-            self.old_command = MCMD(*self.command)
-            if self.is_reset():
+            self.old_command = self.command
+            reset = self.is_reset()
+            ready = self.ready == HREADY.Working
+            if reset:
                 self.do_reset()
-            elif not self.valid_cmd or self.is_ready() or self.resp["hresp"] == HRESP.Failed:
+            elif not self.valid_cmd or ready or self.resp["hresp"] == HRESP.Failed:
                 if self.exclusive_transfers:
                     if self.has_exclusive_pending and self.resp["hexokay"] == HEXOKAY.Failed:
                         self.exclusive_trans = False
                     self.has_exclusive_pending = False
-                if randint(0,1) == 0:
+                if self.random_gen.getrandbits(1) == 0:
                     self.do_nothing()
                 else:
                     self.do_something()
             self.valid_address_stage = False
-            if not self.is_reset() and self.is_ready():
+            if not reset and ready:
                 self.valid_address_stage = True
-            self.eval_done.set()
+            if self._monitoring:
+                self.eval_done.set()
             if self.valid_address_stage:
                 self.delayed = self.to_be_delayed
             await clock_edge
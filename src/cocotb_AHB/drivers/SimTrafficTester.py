@@ -1,8 +1,12 @@
 # Copyright (c) 2022, Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, TypeVar, Tuple, Dict, Set, Any, Optional
+from typing import List, TypeVar, Tuple, Dict, Optional, Deque
 import random
+from collections import deque
+
+from numpy import uint64 # type: ignore
+from numpy.random import default_rng # type: ignore
 
 import cocotb # type: ignore
 from cocotb.handle import SimHandleBase # type: ignore
@@ -17,6 +21,33 @@ from cocotb_AHB.AHB_common.InterconnectInterface import InterconnectInterface
 T = TypeVar('T')
 S = TypeVar('S')
 R = TypeVar('R')
+_HPROT_DEFAULT: HPROT = HPROT()
+# Enum members indexed by their value, cheaper than calling the enum on a random int
+_HBURSTS: Tuple[HBURST, ...] = tuple(HBURST)
+_HSIZES: Tuple[HSIZE, ...] = tuple(HSIZE)
+_HNONSECS: Tuple[HNONSEC, ...] = (HNONSEC.Secure, HNONSEC.NonSecure)
+_HEXCLS: Tuple[HEXCL, ...] = (HEXCL.NonExcl, HEXCL.Excl)
+_HTRANSES: Tuple[HTRANS, ...] = tuple(HTRANS)
+_HWRITES: Tuple[HWRITE, ...] = (HWRITE.Read, HWRITE.Write)
+_HRESPS: Tuple[HRESP, ...] = (HRESP.Successful, HRESP.Failed)
+_HEXOKAYS: Tuple[HEXOKAY, ...] = (HEXOKAY.Failed, HEXOKAY.Successful)
+_RANDOM_BATCH: int = 4096
+
+
+class _RandomWords:
+    # 64-bit random words generated in batches, seeded from the global
+    # generator so the cocotb seed still reproduces a run
+    def __init__(self) -> None:
+        self.random_gen = default_rng(random.getrandbits(64))
+        self.buf: List[int] = []
+
+    def next(self) -> int:
+        buf = self.buf
+        if not buf:
+            buf = self.buf = self.random_gen.integers(0, 1 << 64, _RANDOM_BATCH,
+                                                      dtype=uint64).tolist()
+        return buf.pop()
+
 
 class SimTrafficTester(SimulationInterface):
     class manager_stub(ManagerInterface, SimulationInterface):
@@ -36,6 +67,7 @@ class SimTrafficTester(SimulationInterface):
             self.wait: Event = wait
             self.to_be_delayed: MDATA = MDATA(0)
             self.delayed: MDATA = MDATA(0)
+            self.random_words: _RandomWords = _RandomWords()
 
 
         def set_ready(self, hReady: HREADY) -> None:
@@ -74,19 +106,18 @@ class SimTrafficTester(SimulationInterface):
 
 
         def random_command(self) -> MCMD:
-            self.sub_id = random.randint(0, len(self.addr_map)-1)
-            temp: Dict[Any, Any] = {}
-            temp["hBurst"] = HBURST(random.randint(0, 7))
-            temp["hSize"] = HSIZE(random.randint(0, 2))
-            temp["hNonsec"] = HNONSEC(random.randint(0, 1))
-            temp["hExcl"] = HEXCL(random.randint(0, 1))
-            temp["hTrans"] = HTRANS(random.randint(0, 3))
-            temp["hWstrb"] = random.randint(0, 15)
-            temp["hWrite"] = HWRITE(random.randint(0, 1))
+            # all fields are sliced out of two random words
+            w = self.random_words.next()
+            a = self.random_words.next()
+            self.sub_id = (a & 0xffff) % len(self.addr_map)
+            hSize = _HSIZES[(w >> 12 & 0xffff) % 3]
+            hWrite = _HWRITES[w >> 11 & 1]
             (addr, length) = self.addr_map[self.sub_id]
-            temp["hAddr"] = random.randrange(addr, addr+length, 2**temp["hSize"])
-            self.to_be_delayed = MDATA(random.randint(0, 2*32-1)) if temp["hWrite"] == HWRITE.Write else MDATA(0)
-            return MCMD(**temp)
+            hAddr = addr + (((a >> 16) % ((length + (1 << hSize) - 1) >> hSize)) << hSize)
+            self.to_be_delayed = MDATA(w >> 32 & 0xffffffff) if hWrite == HWRITE.Write else MDATA(0)
+            return MCMD(hAddr, _HBURSTS[w & 7], HMASTLOCK.UnLocked, _HPROT_DEFAULT, hSize,
+                        _HNONSECS[w >> 3 & 1], _HEXCLS[w >> 4 & 1], 0, _HTRANSES[w >> 5 & 3],
+                        w >> 7 & 15, hWrite)
 
 
         def is_reset(self) -> bool:
@@ -104,22 +135,25 @@ class SimTrafficTester(SimulationInterface):
             _loop = True
             while _loop:
                 await readonly
-                self.old_command = MCMD(*self.command)
+                self.old_command = self.command
                 self.old_sub_id = self.sub_id
-                if self.is_reset():
+                reset = self.is_reset()
+                ready = self.ready == HREADY.Working
+                if reset:
                     self.do_reset()
-                elif self.is_ready():
+                elif ready:
                     self.waiting_for_rsp += 1
                     self.command = self.random_command()
                     self.num_transactions -= 1
                 if self.num_transactions == 0:
                     _loop = False
                     self.do_reset()
-                await self.wait.wait()
+                if not self.wait.is_set():
+                    await self.wait.wait()
                 self.done_processing.set()
 
                 self.valid_address_stage = False
-                if not self.is_reset() and self.is_ready():
+                if not reset and ready:
                     self.valid_address_stage = True
                 if self.valid_address_stage:
                     self.delayed = self.to_be_delayed
@@ -129,7 +163,7 @@ class SimTrafficTester(SimulationInterface):
             while True:
                 await readonly
                 self.done_processing.set()
-                self.old_command = MCMD(*self.command)
+                self.old_command = self.command
                 self.old_sub_id = self.sub_id
                 await clock_edge
 
@@ -148,6 +182,7 @@ class SimTrafficTester(SimulationInterface):
             self.active_cmd: bool = False
             self.wait: Event = wait
             self.wdata: int = 0
+            self.random_words: _RandomWords = _RandomWords()
 
 
         def set_ready(self, hReady: HREADY) -> None:
@@ -183,12 +218,10 @@ class SimTrafficTester(SimulationInterface):
 
 
         def random_rsp(self) -> SRESP:
-            temp: Dict[Any, Any] = {}
-            temp["hResp"] = HRESP(random.randint(0, 1)) if self.wait_for > 0 else HRESP.Successful
-            temp["hReadyOut"] = HREADYOUT.NotReady if self.wait_for > 0 else HREADYOUT.Ready
-            temp["hExOkay"] = HEXOKAY(random.randint(0, 1)) if self.wait_for > 0 else HEXOKAY.Failed
-            temp["hRData"] = random.randint(0, 2**32-1) if self.wait_for > 0 else 0
-            return SRESP(**temp)
+            if self.wait_for > 0:
+                w = self.random_words.next()
+                return SRESP(_HRESPS[w & 1], HREADYOUT.NotReady, _HEXOKAYS[w >> 1 & 1], w >> 32)
+            return SRESP(HRESP.Successful, HREADYOUT.Ready, HEXOKAY.Failed, 0)
 
 
         def is_reset(self) -> bool:
@@ -204,15 +237,16 @@ class SimTrafficTester(SimulationInterface):
             readonly = ReadOnly()
             while True:
                 await readonly
-                self.old_response = SRESP(*self.response)
+                self.old_response = self.response
                 if self.is_reset():
                     self.do_reset()
-                elif self.is_ready() and self.command.hSel == HSEL.Sel:
-                    self.wait_for = random.randint(0, 3)
+                elif self.ready == HREADY.Working and self.command.hSel == HSEL.Sel:
+                    self.wait_for = self.random_words.next() & 3
                     self.manager_id = self.command.hMaster>>4
                 self.response = self.random_rsp()
                 self.wait_for -= 1
-                await self.wait.wait()
+                if not self.wait.is_set():
+                    await self.wait.wait()
                 self.done_processing.set()
                 await clock_edge
 
@@ -229,15 +263,14 @@ class SimTrafficTester(SimulationInterface):
         self.manager_sub_addr_map: Dict[Tuple[ManagerInterface, \
                                               SubordinateInterface], \
                                         Tuple[int, int]] = {}
-        self.subordinate_cmd: Dict[SimTrafficTester.subordinate_stub, Set[ICMD]] = {}
-        self.manager_rsp: Dict[SimTrafficTester.manager_stub, List[IRESP]] = {}
+        # indexed by subordinate and manager position
+        self.subordinate_cmd: List[List[ICMD]] = [[] for _ in self.subordinates]
+        self.manager_rsp: List[Deque[IRESP]] = [deque([IRESP()]) for _ in self.managers]
 
         for i, manager in enumerate(self.managers):
             interconnect.register_manager(manager, i)
-            self.manager_rsp[manager] = [IRESP()]
         for subordinate in self.subordinates:
             interconnect.register_subordinate(subordinate)
-            self.subordinate_cmd[subordinate] = set()
         for i, manager in enumerate(self.managers):
             addresses = random.sample(range(2*8, 2**22, 4), num_subordinates)
             for j, subordinate in enumerate(self.subordinates):
@@ -266,26 +299,25 @@ class SimTrafficTester(SimulationInterface):
 
 
     def do_reset(self) -> None:
-        for subordinate in self.subordinates:
-            self.subordinate_cmd[subordinate] = set()
+        self.subordinate_cmd = [[] for _ in self.subordinates]
 
 
     def icmd_from_mcmd(self, cmd: MCMD, manager_id: int) -> ICMD:
-        temp: Dict[Any, Any] = cmd._asdict()
-        temp["hMaster"] = manager_id << 4 | temp["hMaster"]
-        temp["hSel"] = HSEL.Sel
-        return ICMD(**temp)
+        return ICMD(cmd.hAddr, cmd.hBurst, cmd.hMastlock, cmd.hProt, cmd.hSize, cmd.hNonsec,
+                    cmd.hExcl, manager_id << 4 | cmd.hMaster, cmd.hTrans, cmd.hWstrb,
+                    cmd.hWrite, HSEL.Sel)
 
 
     def iresp_from_sresp(self, rsp: SRESP) -> IRESP:
-        return IRESP(hRData=rsp.hRData, hResp=rsp.hResp, hExOkay=rsp.hExOkay)
+        return IRESP(rsp.hResp, rsp.hExOkay, rsp.hRData)
 
 
     async def start(self) -> None:
         clock_edge = RisingEdge(self.clock)
         readonly = ReadOnly()
-        list_of_triggers: List[Event] = [i.done_processing for i in self.managers]
-        list_of_triggers += [i.done_processing for i in self.subordinates]
+        list_of_triggers: Tuple[Event, ...] = tuple(
+            [i.done_processing for i in self.managers] +
+            [i.done_processing for i in self.subordinates])
 
         for manager in self.managers:
             manager.register_clock(self.clock)
@@ -301,39 +333,47 @@ class SimTrafficTester(SimulationInterface):
         while _loop:
             await readonly
             self.prep.set()
-            await Combine(*[i.wait() for i in list_of_triggers])
+            # stubs that already finished this cycle need no trigger
+            pending = [t.wait() for t in list_of_triggers if not t.is_set()]
+            if pending:
+                await Combine(*pending)
             self.prep.clear()
             for t in list_of_triggers:
                 t.clear()
-            for i, manager in enumerate(self.managers):
-                if manager.is_ready():
-                    if manager.old_sub_id is not None:
-                        subordinate = self.subordinates[manager.old_sub_id]
-                        icmd = self.icmd_from_mcmd(manager.old_command, i)
-                        self.subordinate_cmd[subordinate].add(icmd)
-
-            for i, subordinate in enumerate(self.subordinates):
-                if subordinate.is_ready():
-                    manager = self.managers[subordinate.manager_id]
-                    if subordinate.old_response.hReadyOut != HREADYOUT.Ready:
-                        continue
-                    iresp = self.iresp_from_sresp(subordinate.old_response)
-                    self.manager_rsp[manager].append(iresp)
-
-            for manager in self.managers:
-                if manager.is_ready() and manager.running and manager.waiting_for_rsp > 0:
-                    assert manager.response == self.manager_rsp[manager][0], \
-                                f"got: {manager.response} expected:{self.manager_rsp[manager][0]}"
-                    self.manager_rsp[manager] = self.manager_rsp[manager][1:]
-
-            for subordinate in self.subordinates:
-                if subordinate.is_ready() and subordinate.active_cmd:
-                    assert subordinate.command in self.subordinate_cmd[subordinate], \
+            # ready cannot change within the ReadOnly phase
+            ready_managers = [(i, manager) for i, manager in enumerate(self.managers)
+                              if manager.ready == HREADY.Working]
+            ready_subordinates = [(j, subordinate) for j, subordinate in enumerate(self.subordinates)
+                                  if subordinate.ready == HREADY.Working]
+            for i, manager in ready_managers:
+                if manager.old_sub_id is not None:
+                    icmd = self.icmd_from_mcmd(manager.old_command, i)
+                    self.subordinate_cmd[manager.old_sub_id].append(icmd)
+
+            for _, subordinate in ready_subordinates:
+                if subordinate.old_response.hReadyOut != HREADYOUT.Ready:
+                    continue
+                iresp = self.iresp_from_sresp(subordinate.old_response)
+                self.manager_rsp[subordinate.manager_id].append(iresp)
+
+            for i, manager in ready_managers:
+                if manager.running and manager.waiting_for_rsp > 0:
+                    expected_rsp = self.manager_rsp[i]
+                    assert manager.response == expected_rsp[0], \
+                                f"got: {manager.response} expected:{expected_rsp[0]}"
+                    expected_rsp.popleft()
+
+            for j, subordinate in ready_subordinates:
+                if subordinate.active_cmd:
+                    # at most one pending command per manager, a linear scan
+                    # is cheaper than hashing every ICMD
+                    pending_cmds = self.subordinate_cmd[j]
+                    assert subordinate.command in pending_cmds, \
                                 f"got: {subordinate.command} " \
-                                f"expected:{self.subordinate_cmd[subordinate]}"
-                    assert len(self.subordinate_cmd[subordinate]) <= len(self.managers), \
-                            f"{self.subordinate_cmd[subordinate]} {len(self.managers)}"
-                    self.subordinate_cmd[subordinate].remove(subordinate.command)
+                                f"expected:{pending_cmds}"
+                    assert len(pending_cmds) <= len(self.managers), \
+                            f"{pending_cmds} {len(self.managers)}"
+                    pending_cmds.remove(subordinate.command)
 
             _loop = False
             for manager in self.managers:
@@ -4,8 +4,10 @@
 
 from random import randint
 
-from typing import Any, Tuple, Dict, List, Set, Optional, TypeVar, Type
+from typing import Any, Tuple, Dict, List, Set, Optional, TypeVar, Type, Deque, Callable, Iterable
 from copy import copy
+from collections import deque
+from bisect import bisect_right
 from math import log2
 
 import cocotb # type: ignore
@@ -21,12 +23,18 @@ from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 from cocotb_AHB.drivers.SimDefaultSubordinate import SimDefaultSubordinate
 
 T = TypeVar('T', bound='SimInterconnect')
+_IDATA_ZERO: IDATA = IDATA(0)
+# handed to subordinates whose arbiter has nothing queued, NamedTuples are immutable
+_IDLE_ICMD: ICMD = ICMD(0, HBURST.Incr, HMASTLOCK.UnLocked, HPROT(),
+                        HSIZE.Byte, HNONSEC.Secure, HEXCL.NonExcl, 0,
+                        HTRANS.Idle, 0, HWRITE.Read, HSEL.NotSel)
 
 class SimInterconnect(InterconnectInterface, SimulationInterface):
     class Arbiter():
         def __init__(self) -> None:
-            self.command_queue: List[Tuple[ICMD, ManagerInterface]] = []
+            self.command_queue: Deque[Tuple[ICMD, ManagerInterface]] = deque()
             self.interface: Optional[ManagerInterface] = None
+            self.interface_get_data: Optional[Callable[[], MDATA]] = None
 
 
         def queue_cmd(self, cmd: ICMD, manager: ManagerInterface) -> None:
@@ -34,40 +42,47 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
 
 
         def get_cmd(self) -> Tuple[ICMD, Optional[ManagerInterface]]:
-            if len(self.command_queue):
-                cmd, manager = self.command_queue[0]
-                self.command_queue = self.command_queue[1:]
+            if self.command_queue:
+                cmd, manager = self.command_queue.popleft()
                 self.interface = manager
+                self.interface_get_data = manager.get_data
                 return cmd, manager
             else:
                 self.interface = None
-                return ICMD(0, HBURST.Incr, HMASTLOCK.UnLocked, HPROT(),
-                            HSIZE.Byte, HNONSEC.Secure, HEXCL.NonExcl, 0,
-                            HTRANS.Idle, 0, HWRITE.Read, HSEL.NotSel), None
+                self.interface_get_data = None
+                return _IDLE_ICMD, None
 
 
         def get_data(self) -> IDATA:
-            if self.interface is None:
-                return IDATA(0)
-            return IDATA(self.interface.get_data().hWData)
+            get_data = self.interface_get_data
+            if get_data is None:
+                return _IDATA_ZERO
+            return IDATA(get_data().hWData)
 
     def __init__(self) -> None:
-        self.managers_ready: Set[ManagerInterface] = set()
-        self.managers_waiting: Set[ManagerInterface] = set()
+        # every registered manager in registration order, True while it waits for a response
+        self.manager_waiting: Dict[ManagerInterface, bool] = {}
         self.manager_cnt: int = 0
         self.manager_used_id: Set[int] = set()
         self.manager_to_id: Dict[ManagerInterface, int] = {}
         self.id_to_manager: Dict[int, ManagerInterface] = {}
+        # manager_to_id already shifted into the upper hMaster bits
+        self.manager_id_shifted: Dict[ManagerInterface, int] = {}
         self.manager_address_map: Dict[ManagerInterface, List[Tuple[int, int]]] = {}
-        self.manager_id_subordinate_map: Dict[Tuple[ManagerInterface, int], SubordinateInterface] = {}
+        # per manager regions sorted by base address, bases kept apart for bisect
+        self.manager_regions: Dict[ManagerInterface, List[Tuple[int, int, SubordinateInterface]]] = {}
+        self.manager_region_bases: Dict[ManagerInterface, List[int]] = {}
+        # last resolved (start, end, subordinate) per manager, gaps resolve to the default one
+        self.manager_route_cache: Dict[ManagerInterface, Tuple[int, int, SubordinateInterface]] = {}
         self.manager_default_subordinate: Dict[ManagerInterface, SimDefaultSubordinate] = {}
 
-        self.subordinates_ready: Set[SubordinateInterface] = set()
-        self.subordinates_waiting: Set[SubordinateInterface] = set()
+        self.subordinate_waiting: Dict[SubordinateInterface, bool] = {}
         self.subordinates_manager_resp: Dict[SubordinateInterface,
                                              Optional[ManagerInterface]] = {}
 
         self.arbiters: Dict[SubordinateInterface, SimInterconnect.Arbiter] = {}
+        # bound (subordinate.put_data, arbiter.get_data) pairs walked every cycle by proc_data
+        self.data_paths: List[Tuple[Callable[[IDATA], None], Callable[[], IDATA]]] = []
         self.rsp: Dict[ManagerInterface, Tuple[IRESP, HREADY]] = {}
         self.bus_width: Optional[int] = None
         self.first_process: bool = True
@@ -96,8 +111,10 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
                 "2 Managers where given same interconnect_id"
         if interconnect_id is not None:
             self.manager_used_id.add(interconnect_id)
-        self.managers_waiting.add(manager)
+        self.manager_waiting[manager] = True
         self.manager_address_map[manager] = []
+        self.manager_regions[manager] = []
+        self.manager_region_bases[manager] = []
         manager.set_ready(HREADY.WaitState)
         next_valid: int = 0
         while next_valid in self.id_to_manager:
@@ -110,6 +127,7 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
             next_valid = interconnect_id
         self.manager_to_id[manager] = next_valid
         self.id_to_manager[next_valid] = manager
+        self.manager_id_shifted = {m: m_id << 4 for m, m_id in self.manager_to_id.items()}
         if self.bus_width is None:
             self.bus_width = manager.bus_width
         else:
@@ -124,37 +142,92 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
         assert manager in self.manager_address_map, "Manager not registered"
         assert subordinate in self.arbiters, "Subordinate not registered"
         assert address % 1024 == 0, "Subordinate base address must be alligned to 1KiB boundry"
-        cnt = len(self.manager_address_map[manager])
         for _address, _size in self.manager_address_map[manager]:
-            assert address not in range(_address, _address + _size) and \
-                    _address not in range(address, address + size), \
+            assert not _address <= address < _address + _size and \
+                    not address <= _address < address + size, \
                     f"Subordinates memory regions overlap 0x{_address:x}:0x{_address+_size:x} and 0x{address:x}:0x{address+size:x}"
-        self.manager_id_subordinate_map[(manager, cnt)] = subordinate
         self.manager_address_map[manager].append((address, size))
+        self.manager_route_cache.pop(manager, None)
+        # an empty region can never be hit
+        if size > 0:
+            idx = bisect_right(self.manager_region_bases[manager], address)
+            self.manager_region_bases[manager].insert(idx, address)
+            self.manager_regions[manager].insert(idx, (address, address + size, subordinate))
+
+
+    def register_manager_subordinate_addrs(self, manager: ManagerInterface,
+                                           mappings: Iterable[Tuple[SubordinateInterface, int, int]]) -> None:
+        assert manager in self.manager_address_map, "Manager not registered"
+        mappings = list(mappings)
+        for subordinate, address, size in mappings:
+            assert subordinate in self.arbiters, "Subordinate not registered"
+            assert address % 1024 == 0, "Subordinate base address must be alligned to 1KiB boundry"
+        # validate everything on one sorted list, neighbours are enough to find an overlap
+        address_map = self.manager_address_map[manager] + [(address, size) for _, address, size in mappings]
+        regions = sorted((address, size) for address, size in address_map if size > 0)
+        for (_address, _size), (address, size) in zip(regions, regions[1:]):
+            assert _address + _size <= address, \
+                    f"Subordinates memory regions overlap 0x{_address:x}:0x{_address+_size:x} and 0x{address:x}:0x{address+size:x}"
+        bases = [address for address, _ in regions]
+        for address, size in address_map:
+            if size == 0:
+                idx = bisect_right(bases, address) - 1
+                if idx >= 0:
+                    _address, _size = regions[idx]
+                    assert address >= _address + _size, \
+                            f"Subordinates memory regions overlap 0x{_address:x}:0x{_address+_size:x} and 0x{address:x}:0x{address:x}"
+        self.manager_address_map[manager] = address_map
+        self.manager_route_cache.pop(manager, None)
+        sorted_regions = sorted(self.manager_regions[manager] +
+                                [(address, address + size, subordinate)
+                                 for subordinate, address, size in mappings if size > 0],
+                                key=lambda region: region[0])
+        self.manager_regions[manager] = sorted_regions
+        self.manager_region_bases[manager] = [region[0] for region in sorted_regions]
 
 
     def get_subordinate_from_manager_cmd(self, manager: ManagerInterface, cmd: MCMD) -> SubordinateInterface:
-        for i, (addr, length) in enumerate(self.manager_address_map[manager]):
-            if cmd.hAddr in range(addr, addr + length):
-                return self.manager_id_subordinate_map[(manager, i)]
-        return self.manager_default_subordinate[manager]
+        hAddr = cmd.hAddr
+        last = self.manager_route_cache.get(manager)
+        if last is not None and last[0] <= hAddr < last[1]:
+            return last[2]
+        bases = self.manager_region_bases[manager]
+        regions = self.manager_regions[manager]
+        idx = bisect_right(bases, hAddr) - 1
+        gap_start = 0
+        if idx >= 0:
+            region = regions[idx]
+            if hAddr < region[1]:
+                self.manager_route_cache[manager] = region
+                return region[2]
+            gap_start = region[1]
+        gap_end = bases[idx + 1] if idx + 1 < len(bases) else 1 << 64
+        subordinate = self.manager_default_subordinate[manager]
+        self.manager_route_cache[manager] = (gap_start, gap_end, subordinate)
+        return subordinate
 
 
     def change_manager_id(self, cmd: MCMD, manager: ManagerInterface) -> MCMD:
-        m_id = self.manager_to_id[manager]
-        new_id = m_id << 4 | cmd.hMaster
-        return MCMD(hAddr=cmd.hAddr, hBurst=cmd.hBurst, hMastlock=cmd.hMastlock,
-                    hProt=cmd.hProt, hSize=cmd.hSize, hNonsec=cmd.hNonsec,
-                    hExcl=cmd.hExcl, hMaster=new_id, hTrans=cmd.hTrans,
-                    hWstrb=cmd.hWstrb, hWrite=cmd.hWrite)
+        return MCMD(cmd.hAddr, cmd.hBurst, cmd.hMastlock, cmd.hProt, cmd.hSize, cmd.hNonsec,
+                    cmd.hExcl, self.manager_id_shifted[manager] | cmd.hMaster, cmd.hTrans,
+                    cmd.hWstrb, cmd.hWrite)
+
+
+    def _build_sub_icmd(self, cmd: MCMD, manager: ManagerInterface) -> ICMD:
+        # change_manager_id and the MCMD -> ICMD conversion in one construction
+        hAddr, hBurst, hMastlock, hProt, hSize, hNonsec, hExcl, hMaster, hTrans, hWstrb, hWrite = cmd
+        return ICMD(hAddr, hBurst, hMastlock, hProt, hSize, hNonsec, hExcl,
+                    self.manager_id_shifted[manager] | hMaster, hTrans, hWstrb, hWrite, HSEL.Sel)
 
 
     def register_subordinate(self: T, subordinate: SubordinateInterface,
                              name: Optional[str] = None) -> T:
         assert subordinate not in self.arbiters, "Subordinate already registered"
-        self.subordinates_waiting.add(subordinate)
+        self.subordinate_waiting[subordinate] = True
         subordinate.set_ready(HREADY.WaitState)
         self.arbiters[subordinate] = SimInterconnect.Arbiter()
+        self.data_paths = [(subordinate.put_data, arbiter.get_data)
+                           for subordinate, arbiter in self.arbiters.items()]
         if self.bus_width is None:
             self.bus_width = subordinate.bus_width
         else:
@@ -165,82 +238,84 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
     def prep_default(self) -> None:
         for _, subordinate in self.manager_default_subordinate.items():
             cocotb.start_soon(subordinate.register_clock(self.clock).register_reset(self.reset, self.inverted).start())
-            self.subordinates_waiting.add(subordinate)
+            self.subordinate_waiting[subordinate] = True
             subordinate.set_ready(HREADY.WaitState)
             self.arbiters[subordinate] = SimInterconnect.Arbiter()
+        self.data_paths = [(subordinate.put_data, arbiter.get_data)
+                           for subordinate, arbiter in self.arbiters.items()]
 
 
     def do_reset(self) -> None:
-        for manager in self.managers_waiting:
-            manager.set_ready(HREADY.Working)
-            manager.put_rsp(IRESP())
-            self.managers_ready.add(manager)
-
-        self.managers_waiting -= self.managers_ready
-
-        for subordinate in self.subordinates_waiting:
-            subordinate.set_ready(HREADY.Working)
-            subordinate.put_cmd(ICMD())
-            self.subordinates_ready.add(subordinate)
-
-        self.subordinates_waiting -= self.subordinates_ready
+        manager_waiting = self.manager_waiting
+        for manager, waiting in manager_waiting.items():
+            if waiting:
+                manager.set_ready(HREADY.Working)
+                manager.put_rsp(IRESP())
+                manager_waiting[manager] = False
+
+        subordinate_waiting = self.subordinate_waiting
+        for subordinate, waiting in subordinate_waiting.items():
+            if waiting:
+                subordinate.set_ready(HREADY.Working)
+                subordinate.put_cmd(ICMD())
+                subordinate_waiting[subordinate] = False
 
-        self.subordinates_manager_resp = {}
-        self.rsp = {}
+        self.subordinates_manager_resp.clear()
+        self.rsp.clear()
 
 
     def proc_data(self) -> None:
-        for subordinate, arbiter in self.arbiters.items():
-            subordinate.put_data(arbiter.get_data())
+        for put_data, get_data in self.data_paths:
+            put_data(get_data())
 
 
     def proc_rsp(self) -> None:
-        for subordinate in self.subordinates_waiting:
-            rsp = subordinate.get_rsp()
+        subordinate_waiting = self.subordinate_waiting
+        for subordinate, waiting in subordinate_waiting.items():
+            if not waiting:
+                continue
+            hResp, hReadyOut, hExOkay, hRData = subordinate.get_rsp()
             manager = self.subordinates_manager_resp[subordinate]
             assert manager is not None
-            self.rsp[manager] = (IRESP(hRData=rsp.hRData,
-                                       hResp=rsp.hResp,
-                                       hExOkay=rsp.hExOkay),
-        HREADY.Working if rsp.hReadyOut == HREADYOUT.Ready else HREADY.WaitState)
-            if rsp.hReadyOut == HREADYOUT.Ready:
+            done = hReadyOut == HREADYOUT.Ready
+            self.rsp[manager] = (IRESP(hResp, hExOkay, hRData),
+                                 HREADY.Working if done else HREADY.WaitState)
+            if done:
                 subordinate.set_ready(HREADY.Working)
                 self.subordinates_manager_resp[subordinate] = None
-                self.subordinates_ready.add(subordinate)
-
-        self.subordinates_waiting -= self.subordinates_ready
+                subordinate_waiting[subordinate] = False
 
+        manager_waiting = self.manager_waiting
         for imanager, (irsp, ready) in self.rsp.items():
             imanager.put_rsp(irsp)
             if ready == HREADY.Working:
                 imanager.set_ready(ready)
-                self.managers_ready.add(imanager)
-
-        self.managers_waiting -= self.managers_ready
-        self.rsp = {}
+                manager_waiting[imanager] = False
+        self.rsp.clear()
 
 
     def proc_cmd(self) -> None:
-        for manager in self.managers_ready:
+        # every ready manager issues a command and starts waiting
+        manager_waiting = self.manager_waiting
+        for manager, waiting in manager_waiting.items():
+            if waiting:
+                continue
             cmd = manager.get_cmd()
             subordinate = self.get_subordinate_from_manager_cmd(manager, cmd)
-            cmd = self.change_manager_id(cmd, manager)
-            sub_cmd = ICMD(*cmd, HSEL.Sel)
             arbiter = self.arbiters[subordinate]
-            arbiter.queue_cmd(sub_cmd, manager)
-            self.managers_waiting.add(manager)
-
-        self.managers_ready -= self.managers_waiting
+            arbiter.queue_cmd(self._build_sub_icmd(cmd, manager), manager)
+            manager_waiting[manager] = True
 
-        for subordinate in self.subordinates_ready:
+        subordinate_waiting = self.subordinate_waiting
+        for subordinate, waiting in subordinate_waiting.items():
+            if waiting:
+                continue
             arbiter = self.arbiters[subordinate]
             icmd, imanager = arbiter.get_cmd()
             subordinate.put_cmd(icmd)
             if imanager is not None:
                 self.subordinates_manager_resp[subordinate] = imanager
-                self.subordinates_waiting.add(subordinate)
-
-        self.subordinates_ready -= self.subordinates_waiting
+                subordinate_waiting[subordinate] = True
 
 
     async def start(self) -> None:
@@ -260,11 +335,13 @@ class SimInterconnect(InterconnectInterface, SimulationInterface):
         if self.is_reset():
             self.do_reset()
         else:
-            for manager in self.managers_waiting:
-                manager.set_ready(HREADY.WaitState)
+            for manager, waiting in self.manager_waiting.items():
+                if waiting:
+                    manager.set_ready(HREADY.WaitState)
 
-            for subordinate in self.subordinates_waiting:
-                subordinate.set_ready(HREADY.WaitState)
+            for subordinate, waiting in self.subordinate_waiting.items():
+                if waiting:
+                    subordinate.set_ready(HREADY.WaitState)
 
             self.proc_data()
             self.proc_rsp()
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Type, Dict, Any, TypeVar
+import logging
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly # type: ignore
@@ -22,6 +23,7 @@ class AHBPacketMonitor(SimMonitorInterface):
 
     def register_device(self: T, device: MonitorableInterface) -> T:
         self.device = device
+        device._monitoring = True
         return self
 
 
@@ -51,9 +53,13 @@ class AHBPacketMonitor(SimMonitorInterface):
                     self.packet_in_address_phase.cmd(status.command)
                     self.packet_in_data_phase.rsp(status.resp)
                     self.packet_in_data_phase.wdata(status.wdata)
-                    self.log.info(self.packet_in_data_phase)
-                    self.packet_in_data_phase = self.packet_in_address_phase
-                    self.packet_in_address_phase = Packet()
+                    # the packet object is reused below, so the record gets its text now
+                    if self.log.isEnabledFor(logging.INFO):
+                        self.log.info(str(self.packet_in_data_phase))
+                    # ping-pong the two packets instead of allocating a new one
+                    self.packet_in_data_phase, self.packet_in_address_phase = \
+                        self.packet_in_address_phase, self.packet_in_data_phase
+                    self.packet_in_address_phase.reset()
                 self.packet_in_address_phase.age()
                 self.packet_in_data_phase.age()
             await clock_edge
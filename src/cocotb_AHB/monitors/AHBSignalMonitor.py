@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Type, Dict, Any, TypeVar
+import logging
 
 from cocotb.handle import SimHandleBase # type: ignore
 from cocotb.triggers import RisingEdge, ReadOnly # type: ignore
@@ -13,6 +14,19 @@ from cocotb_AHB.AHB_common.MonitorInterface import SimMonitorInterface
 from cocotb_AHB.AHB_common.SimulationInterface import SimulationInterface
 
 T = TypeVar('T')
+# signal and field names are a closed set
+_LABELS: Dict[Any, str] = {}
+
+def _format_fields(prefix: str, fields: Dict[Any, Any]) -> str:
+    parts = [prefix]
+    for key, val in fields.items():
+        label = _LABELS.get(key)
+        if label is None:
+            label = _LABELS[key] = key.capitalize() + ": "
+        parts.append(label)
+        parts.append(str(val) if type(val) is not int else hex(val))
+        parts.append("; ")
+    return "".join(parts)
 
 class AHBSignalMonitor(SimMonitorInterface):
     def __init__(self, name: str =""):
@@ -21,6 +35,7 @@ class AHBSignalMonitor(SimMonitorInterface):
 
     def register_device(self: T, device: MonitorableInterface) -> T:
         self.device = device
+        device._monitoring = True
         return self
 
 
@@ -40,23 +55,11 @@ class AHBSignalMonitor(SimMonitorInterface):
 
 
     def parse_cmd(self, cmd: Dict[Any,Any]) -> str:
-        _ret: str = "Command: "
-        for key, val in cmd.items():
-            if type(val) is not int:
-                _ret += key.capitalize() + ": " + str(val) + "; "
-            else:
-                _ret += key.capitalize() + ": " + str(hex(val)) + "; "
-        return _ret
+        return _format_fields("Command: ", cmd)
 
 
     def parse_resp(self, rsp: Dict[Any,Any]) -> str:
-        _ret: str = "Response: "
-        for key, val in rsp.items():
-            if type(val) is not int:
-                _ret += key.capitalize() + ": " + str(val) + "; "
-            else:
-                _ret += key.capitalize() + ": " + str(hex(val)) + "; "
-        return _ret
+        return _format_fields("Response: ", rsp)
 
 
     async def start(self) -> None:
@@ -65,9 +68,11 @@ class AHBSignalMonitor(SimMonitorInterface):
         while True:
             await readonly
             status = await self.device.monitor_get_status()
-            self.log.info(f"Bus ready signal: {status.ready}\n"
-                          f"Bus reset signal: {self.is_reset()}\n"
-                          + self.parse_resp(status.resp) + "\n"
-                          + self.parse_cmd(status.command) + "\n"
-                          + f"Hwdata: {status.wdata}")
+            # the report is only built when it is going to be emitted
+            if self.log.isEnabledFor(logging.INFO):
+                self.log.info(f"Bus ready signal: {status.ready}\n"
+                              f"Bus reset signal: {self.is_reset()}\n"
+                              + self.parse_resp(status.resp) + "\n"
+                              + self.parse_cmd(status.command) + "\n"
+                              + f"Hwdata: {status.wdata}")
             await clock_edge
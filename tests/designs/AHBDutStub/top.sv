@@ -0,0 +1,31 @@
+// AHB signals exposed as ports, DUTSubordinate drives the command signals
+// and DUTManager samples them back from the same handles
+module top (
+  input  wire        clk,
+  input  wire        rstn,
+  input  wire [31:0] haddr,
+  input  wire  [2:0] hburst,
+  input  wire        hmastlock,
+  input  wire  [6:0] hprot,
+  input  wire  [2:0] hsize,
+  input  wire        hnonsec,
+  input  wire        hexcl,
+  input  wire  [3:0] hmaster,
+  input  wire  [1:0] htrans,
+  input  wire [31:0] hwdata,
+  input  wire  [3:0] hwstrb,
+  input  wire        hwrite,
+  input  wire        hsel,
+  input  wire [31:0] hrdata,
+  input  wire        hready,
+  input  wire        hreadyout,
+  input  wire        hresp,
+  input  wire        hexokay
+);
+  `ifdef COCOTB_SIM
+  initial begin
+    $dumpfile ("waveforms.vcd");
+    $dumpvars;
+  end
+  `endif
+endmodule
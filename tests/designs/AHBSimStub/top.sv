@@ -1,7 +1,16 @@
 module top (
+`ifdef HDL_CLOCK
+  output reg        clk,
+`else
   input  wire       clk,
+`endif
   input  wire       rstn
 );
+  `ifdef HDL_CLOCK
+  // 10ns period, matches CLK_PERIOD of the Python driven clock
+  initial clk = 1'b0;
+  always #5 clk = ~clk;
+  `endif
   `ifdef COCOTB_SIM
   initial begin
     $dumpfile ("waveforms.vcd");
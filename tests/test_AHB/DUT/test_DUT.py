@@ -0,0 +1,57 @@
+import cocotb # type: ignore
+from cocotb.handle import SimHandle # type: ignore
+from cocotb.triggers import Timer # type: ignore
+from cocotb_AHB.AHB_common.AHB_types import *
+from cocotb_AHB.drivers.DutManager import DUTManager
+from cocotb_AHB.drivers.DutSubordinate import DUTSubordinate
+
+
+@cocotb.test() # type: ignore
+async def test_hprot_encoding(dut: SimHandle) -> None:
+    hprots = [int_to_hProt(value) for value in range(1 << 7)]
+    assert len(set(hprots)) == len(hprots), "HPROT encodings are not unique"
+    for value, hprot in enumerate(hprots):
+        assert hProt_to_int(hprot) == value, f"{hprot} != {value}"
+    assert int_to_hProt(hProt_to_int(HPROT())) == HPROT()
+
+
+@cocotb.test() # type: ignore
+async def test_hprot(dut: SimHandle) -> None:
+    subordinate = DUTSubordinate(dut, 32)
+    manager = DUTManager(dut, 32)
+    for value in range(1 << 7):
+        hprot = int_to_hProt(value)
+        subordinate.put_cmd(ICMD(0x100 + value, HBURST.Incr4, HMASTLOCK.Locked, hprot,
+                                 HSIZE.Word, HNONSEC.NonSecure, HEXCL.Excl, 3, HTRANS.Seq,
+                                 0xf, HWRITE.Write, HSEL.Sel))
+        await Timer(1, units='ns')
+        assert int(dut.hprot.value) == value, f"{int(dut.hprot.value)} != {value}"
+        cmd = manager.get_cmd()
+        assert cmd == MCMD(0x100 + value, HBURST.Incr4, HMASTLOCK.Locked, hprot,
+                           HSIZE.Word, HNONSEC.NonSecure, HEXCL.Excl, 3, HTRANS.Seq,
+                           0xf, HWRITE.Write), f"{cmd}"
+
+
+@cocotb.test() # type: ignore
+async def test_subordinate_monitor(dut: SimHandle) -> None:
+    subordinate = DUTSubordinate(dut, 32)
+    manager = DUTManager(dut, 32)
+    subordinate.put_cmd(ICMD(0x44, HBURST.Wrap8, HMASTLOCK.Locked, int_to_hProt(0x5A),
+                             HSIZE.Halfword, HNONSEC.NonSecure, HEXCL.Excl, 5, HTRANS.NonSeq,
+                             0x3, HWRITE.Read, HSEL.Sel))
+    subordinate.put_data(IDATA(0x55AA55AA))
+    subordinate.set_ready(HREADY.Working)
+    manager.put_rsp(IRESP(HRESP.Failed, HEXOKAY.Successful, 0x12345678))
+    dut.hreadyout.value = HREADYOUT.Ready
+    await Timer(1, units='ns')
+    status = await subordinate.monitor_get_status()
+    assert not status.is_manager
+    assert status.ready
+    assert status.wdata == 0x55AA55AA
+    assert status.resp == {"hrdata": 0x12345678, "hreadyout": HREADYOUT.Ready,
+                           "hresp": HRESP.Failed, "hexokay": HEXOKAY.Successful}, f"{status.resp}"
+    assert status.command == {"haddr": 0x44, "hburst": HBURST.Wrap8, "hmastlock": HMASTLOCK.Locked,
+                              "hprot": 0x5A, "hsize": HSIZE.Halfword, "hnonsec": HNONSEC.NonSecure,
+                              "hexcl": HEXCL.Excl, "hmaster": 5, "htrans": HTRANS.NonSeq,
+                              "hwdata": 0x55AA55AA, "hwstrb": 0x3, "hwrite": HWRITE.Read,
+                              "hsel": HSEL.Sel}, f"{status.command}"
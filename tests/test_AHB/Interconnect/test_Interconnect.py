@@ -16,6 +16,7 @@ from cocotb_AHB.interconnect.SimInterconnect import SimInterconnect
 
 from cocotb_AHB.drivers.SimMem1PSubordinate import SimMem1PSubordinate
 from cocotb_AHB.drivers.SimDefaultSubordinate import SimDefaultSubordinate
+from cocotb_AHB.drivers.SimSimpleManager import SimSimpleManager
 
 from cocotb_AHB.monitors.AHBSignalMonitor import AHBSignalMonitor
 from cocotb_AHB.monitors.AHBPacketMonitor import AHBPacketMonitor
@@ -45,8 +46,11 @@ async def _test(dut: SimHandle, managers: List[ManagerInterface],
         interconnect.register_manager(manager)
     for subordinate in subordinates:
         interconnect.register_subordinate(subordinate)
-    for mapping in manager_subordinate_addr_map:
-        interconnect.register_manager_subordinate_addr(*mapping)
+    manager_mappings: Dict[ManagerInterface, List[Tuple[SubordinateInterface, int, int]]] = {}
+    for manager, subordinate, address, size in manager_subordinate_addr_map:
+        manager_mappings.setdefault(manager, []).append((subordinate, address, size))
+    for manager, mappings in manager_mappings.items():
+        interconnect.register_manager_subordinate_addrs(manager, mappings)
 
     interconnect_wrapper = InterconnectWrapper()
     interconnect_wrapper.register_clock(dut.clk)
@@ -256,6 +260,49 @@ async def test_default_subordinate(dut: SimHandle) -> None:
                  (manager, sub1, 0x8000, 0x4000)])
 
 
+async def test_simple_manager_read(dut: SimHandle, read: Tuple[int, int, int, List[HSIZE]]) -> None:
+    bus_width, address, length, sizes = read
+    sub0 = SimMem1PSubordinate(0x4000, bus_width)
+    sub0.register_clock(dut.clk)
+    sub0.register_reset(dut.rstn, True)
+    await cocotb.start(sub0.start())
+
+    manager = SimSimpleManager(bus_width)
+    manager.register_clock(dut.clk)
+    manager.register_reset(dut.rstn, True)
+    await cocotb.start(manager.start())
+
+    interconnect = SimInterconnect()
+    interconnect.register_clock(dut.clk)
+    interconnect.register_reset(dut.rstn, True)
+    interconnect.register_manager(manager)
+    interconnect.register_subordinate(sub0)
+    interconnect.register_manager_subordinate_addr(manager, sub0, 0x4000, 0x4000)
+
+    interconnect_wrapper = InterconnectWrapper()
+    interconnect_wrapper.register_clock(dut.clk)
+    interconnect_wrapper.register_reset(dut.rstn, True)
+    interconnect_wrapper.register_interconnect(interconnect)
+    await cocotb.start(interconnect_wrapper.start())
+
+    await setup_dut(dut)
+    await RisingEdge(dut.clk)
+
+    value = [(0x11 * i) & 0xFF for i in range(1, 33)]
+    manager.write(0x4000, len(value), value, [True] * len(value))
+    await manager.transfer_done()
+
+    manager.read(address, length)
+    await manager.transfer_done()
+    beats = [command for command, _ in manager.commands]
+    assert [beat.hSize for beat in beats] == sizes, f"{[beat.hSize for beat in beats]} != {sizes}"
+    assert all(beat.hAddr % 2**beat.hSize == 0 for beat in beats), "Unaligned beat"
+    assert manager.get_rsp_success() == [False] * len(beats), "Read failed"
+    data = manager.get_rsp(address, bus_width//8)
+    expected = value[address - 0x4000:address - 0x4000 + length]
+    assert data == expected, f"{data} != {expected}"
+
+
 async def test_factory(dut: SimHandle, num_managers: int, num_subordinates: int,
                        num_of_transactions: int = 100) -> None:
     if num_managers * num_of_transactions * num_subordinates > 204800 or num_managers * num_of_transactions > 5000:
@@ -267,8 +314,11 @@ async def test_factory(dut: SimHandle, num_managers: int, num_subordinates: int,
 
     trafic_gen = SimTrafficTester(num_managers, num_subordinates, interconnect, num_of_transactions)
     trafic_gen.register_clock(dut.clk).register_reset(dut.rstn, True)
+    man_mappings: Dict[ManagerInterface, List[Tuple[SubordinateInterface, int, int]]] = {}
     for (man, sub), (addr, length) in trafic_gen.manager_subordinate_addr_map().items():
-        interconnect.register_manager_subordinate_addr(man, sub, addr, length)
+        man_mappings.setdefault(man, []).append((sub, addr, length))
+    for man, mappings in man_mappings.items():
+        interconnect.register_manager_subordinate_addrs(man, mappings)
 
     interconnect_wrapper = InterconnectWrapper()
     interconnect_wrapper.register_clock(dut.clk)
@@ -291,3 +341,12 @@ test_ans.add_option('num_managers', (1, 2, 4, 8, 16, 32))
 test_ans.add_option('num_subordinates', (1, 2, 4, 8, 16, 32, 64))
 test_ans.add_option('num_of_transactions', (100, 1000, 2000, 5000))
 test_ans.generate_tests()
+
+test_ans = TestFactory(test_simple_manager_read)
+test_ans.add_option('read', (
+    (8, 0x4003, 12, [HSIZE.Byte] * 12),
+    (32, 0x4003, 12, [HSIZE.Byte, HSIZE.Word, HSIZE.Word, HSIZE.Halfword, HSIZE.Byte]),
+    (32, 0x4006, 9, [HSIZE.Halfword, HSIZE.Word, HSIZE.Halfword, HSIZE.Byte]),
+    (64, 0x4001, 20, [HSIZE.Byte, HSIZE.Halfword, HSIZE.Word, HSIZE.Doubleword, HSIZE.Word, HSIZE.Byte]),
+))
+test_ans.generate_tests()
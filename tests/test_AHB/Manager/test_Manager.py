@@ -1,4 +1,4 @@
-from random import randint
+from random import getrandbits
 from typing import List, Type, Optional
 
 import cocotb # type: ignore
@@ -18,9 +18,13 @@ from cocotb_AHB.monitors.AHBSignalMonitor import AHBSignalMonitor
 from cocotb_AHB.monitors.AHBPacketMonitor import AHBPacketMonitor
 
 CLK_PERIOD = (10, "ns")
+# transfers that do not have to be held during a wait state
+_NOT_HELD_TRANS = frozenset((HTRANS.Idle, HTRANS.Busy))
 
 async def setup_dut(dut: SimHandle) -> None:
-    await cocotb.start(Clock(dut.clk, *CLK_PERIOD).start())
+    # the toplevel may generate the clock itself, see the Makefile
+    if "hdl_clock" not in cocotb.plusargs:
+        await cocotb.start(Clock(dut.clk, *CLK_PERIOD).start())
     dut.rstn.value = 0
     await ClockCycles(dut.clk, 10)
     await RisingEdge(dut.clk)
@@ -35,10 +39,12 @@ async def reset_AHB(dut: SimHandle,
         manager.set_ready(HREADY.WaitState)
         manager.put_rsp(IRESP(HRESP.Failed, HEXOKAY.Failed, 0))
 
+    risingedge = RisingEdge(dut.clk)
+    readwrite = ReadWrite()
     await ReadOnly()
     while dut.rstn.value == 0:
-        await RisingEdge(dut.clk)
-        await ReadWrite()
+        await risingedge
+        await readwrite
         for manager in managers:
             manager.put_rsp(IRESP(HRESP.Failed, HEXOKAY.Failed, 0))
 
@@ -66,71 +72,91 @@ async def _test(dut: SimHandle, address_width: int, bus_width: int,
         await cocotb.start(monitor.start())
 
     random_gen = default_rng()
+    cycles = 10000
+    # all per cycle random draws are sampled up front
+    stall_roll = random_gen.integers(0, 100, cycles).tolist()
+    waits = random_gen.poisson(5, cycles).clip(max=60).tolist()
+    excl_roll = random_gen.integers(0, 10, cycles).tolist()
+    resp_roll = random_gen.integers(0, 6, cycles).tolist()
+    # numpy integers are bounded by int64, wider buses draw in Python
+    if bus_byte_width < 63:
+        rdata = random_gen.integers(0, 2**bus_byte_width, cycles).tolist()
+    else:
+        rdata = [getrandbits(bus_byte_width) for _ in range(cycles)]
+    addr_limit = 1 << address_width
+    data_limit = 1 << bus_width
+    full_strb = (1 << bus_byte_width) - 1
 
     await cocotb.start(setup_dut(dut))
     await reset_AHB(dut, [manager])
     risingedge = RisingEdge(dut.clk)
+    readwrite = ReadWrite()
     command: MCMD
     was_in_rst = True
-    for i in range(0, 10000):
+    for i in range(0, cycles):
         manager.set_ready(HREADY.Working)
         command = manager.get_cmd()
-        assert command.hAddr in range(0, 2**address_width), \
+        assert 0 <= command.hAddr < addr_limit, \
             "Address out of range"
-        assert command.hBurst == HBURST.Incr or burst, \
+        assert burst or command.hBurst == HBURST.Incr, \
             "Burst command from non bursting Manager"
-        assert command.hMastlock == HMASTLOCK.UnLocked or locking, \
+        assert locking or command.hMastlock == HMASTLOCK.UnLocked, \
             "Lock from non locking Manager"
-        assert 2**command.hSize <= bus_byte_width, \
+        assert 1 << command.hSize <= bus_byte_width, \
             "Transfer szie greater than data bus width"
-        assert command.hNonsec == HNONSEC.Secure or secure_transfer, \
+        assert secure_transfer or command.hNonsec == HNONSEC.Secure, \
             "Non secure transfer from Manager without secure transfers"
-        assert command.hExcl != HEXCL.Excl or exclusive_transfers, \
+        assert exclusive_transfers or command.hExcl != HEXCL.Excl, \
             "Exclusive packet from Manager without exclusive transfers"
-        assert command.hTrans in [HTRANS.Idle, HTRANS.NonSeq] or burst, \
+        assert burst or command.hTrans in [HTRANS.Idle, HTRANS.NonSeq], \
             "Non bursting Manager send burst type transfer"
-        assert command.hTrans in [HTRANS.Idle, HTRANS.Busy] or command.hWrite != HWRITE.Write or \
-            command.hWstrb == 2**bus_byte_width - 1 or write_strobe, \
+        assert write_strobe or command.hTrans in [HTRANS.Idle, HTRANS.Busy] or command.hWrite != HWRITE.Write or \
+            command.hWstrb == full_strb, \
             f"Manager without write strobe support send non full mask {command.hWstrb}"
-        assert command.hWrite != HWRITE.Write or 2**command.hSize <= bus_byte_width, \
+        assert command.hWrite != HWRITE.Write or 1 << command.hSize <= bus_byte_width, \
             "Packet size greater than bus width"
         await risingedge
         wdata = manager.get_data()
-        assert wdata.hWData in range(0, 2**bus_width), \
+        assert 0 <= wdata.hWData < data_limit, \
             "Transfer data not in integer range of data bus"
-        await ReadWrite()
-        if randint(0, 99) in range(0,25): # stall
-            wait_for = min(random_gen.poisson(5), 60)
+        await readwrite
+        if stall_roll[i] < 25: # stall
+            wait_for = waits[i]
             last_command: Optional[MCMD] = None
             manager.put_rsp(IRESP(HRESP.Successful, HEXOKAY.Failed, 0))
             manager.set_ready(HREADY.WaitState)
-            for i in range(0, wait_for):
+            for _ in range(0, wait_for):
                 new_command = manager.get_cmd()
-                assert last_command is None or (last_command[8] == HTRANS.Idle or new_command[8] == HTRANS.NonSeq) \
-                       or burst and (last_command[8] == HTRANS.Busy or new_command[8] == HTRANS.Seq), \
-                    f"Manager changed command during wait state from HTRANS.Idle to {last_command[8].__str__()}" \
-                    f" to {new_command[8].__str__()}, only HTRANS.NonSeq is allowed"
-                if last_command is not None and last_command[8] not in [HTRANS.Idle, HTRANS.Busy]:
-                    assert last_command == new_command, f"\n{last_command}\n{new_command}"
+                if last_command is not None:
+                    last_trans = last_command.hTrans
+                    new_trans = new_command.hTrans
+                    assert last_trans == HTRANS.Idle or new_trans == HTRANS.NonSeq \
+                           or burst and (last_trans == HTRANS.Busy or new_trans == HTRANS.Seq), \
+                        f"Manager changed command during wait state from HTRANS.Idle to {last_trans!s}" \
+                        f" to {new_trans!s}, only HTRANS.NonSeq is allowed"
+                    if last_trans not in _NOT_HELD_TRANS:
+                        assert last_command == new_command, f"\n{last_command}\n{new_command}"
                 last_command = new_command
                 await risingedge
                 new_wdata = manager.get_data()
                 assert wdata.hWData == new_wdata.hWData, "WData mustn't change during wait state"
-                await ReadWrite()
+            # nothing is driven while stalled, only the response after the stall needs ReadWrite
+            if wait_for:
+                await readwrite
         excl = HEXOKAY.Failed
-        if command[6] == HEXCL.Excl and randint(0, 9) not in [0,1]:
+        if command.hExcl == HEXCL.Excl and excl_roll[i] >= 2:
             excl = HEXOKAY.Successful
         resp = HRESP.Successful
-        if randint(0,5) in [4,5]:
+        if resp_roll[i] >= 4:
             resp = HRESP.Failed
         data = 0
-        if command[10] == HWRITE.Read:
-            data = randint(0, 2**bus_byte_width-1)
+        if command.hWrite == HWRITE.Read:
+            data = rdata[i]
         manager.put_rsp(IRESP(resp, excl, data))
         if resp == HRESP.Failed:
             manager.set_ready(HREADY.WaitState)
             await risingedge
-            await ReadWrite()
+            await readwrite
 
 
 async def test_simple(dut: SimHandle, address_width: int, bus_width: int) -> None:
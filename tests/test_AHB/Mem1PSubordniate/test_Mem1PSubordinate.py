@@ -207,6 +207,19 @@ async def test_write_strobe(dut: SimHandle, length: int, bus_width: int, sel: HS
     await _test(dut, length, bus_width, sel, new_commands, new_answers, write_strobe=True)
 
 
+async def test_burst(dut: SimHandle, length: int, bus_width: int, sel: HSEL,
+                     commands_answers: List[Tuple[Tuple[int, HSIZE, HBURST, HTRANS, HWRITE, int], int]]) -> None:
+    bus_byte_width = bus_width//8
+    new_commands: List[Tuple[int, HSIZE, HBURST, HTRANS, HWRITE, HEXCL, HNONSEC, int, int]] = []
+    new_answers: List[Tuple[int, HRESP, HEXOKAY]] = []
+    for command, answer in commands_answers:
+        new_commands.append((command[0], command[1], command[2],
+                             command[3], command[4], HEXCL.NonExcl,
+                             HNONSEC.Secure, command[5], (2**bus_byte_width-1)))
+        new_answers.append((answer, HRESP.Successful, HEXOKAY.Failed))
+    await _test(dut, length, bus_width, sel, new_commands, new_answers, burst=True)
+
+
 async def test_secure_transfer(dut: SimHandle, length: int, bus_width: int, sel: HSEL,
                                write_nonsec: bool, read_nonsec: bool,
                                commands_answers: List[Tuple[Tuple[int, HSIZE, HTRANS, HWRITE, int, HNONSEC], Tuple[int, HRESP]]]) -> None:
@@ -273,6 +286,7 @@ should_fail.add_option('bus_width', (32,))
 should_fail.add_option('sel', (HSEL.Sel, HSEL.NotSel))
 should_fail.add_option('commands', ([(0x3F4, HSIZE.Word, HBURST.Incr4, HTRANS.NonSeq, HWRITE.Write)],
                                     [(0x3E4, HSIZE.Word, HBURST.Incr8, HTRANS.NonSeq, HWRITE.Write)],
+                                    [(0x3F2, HSIZE.Halfword, HBURST.Incr8, HTRANS.NonSeq, HWRITE.Write)],
                                     [(0x3C4, HSIZE.Word, HBURST.Incr16, HTRANS.NonSeq, HWRITE.Write)],
                                     [(0x380, HSIZE.Word, HBURST.Incr16, HTRANS.NonSeq, HWRITE.Write),
                                      (0x380, HSIZE.Word, HBURST.Incr16, HTRANS.Seq, HWRITE.Write)],
@@ -346,6 +360,32 @@ test_ans.add_option('commands_answers', (
         ((0x2, HSIZE.Halfword, HTRANS.NonSeq, HWRITE.Write, 0xAACC0000), 0),
         ((0x0, HSIZE.Word, HTRANS.NonSeq, HWRITE.Read, 0x0), 0xAACCBB78),
     ],
+    [
+        ((0x404, HSIZE.Word, HTRANS.NonSeq, HWRITE.Write, 0xDEADBEEF), 0),
+        ((0x4, HSIZE.Word, HTRANS.NonSeq, HWRITE.Read, 0x0), 0xDEADBEEF),
+        ((0x7FE, HSIZE.Halfword, HTRANS.NonSeq, HWRITE.Write, 0x55AA0000), 0),
+        ((0x3FC, HSIZE.Word, HTRANS.NonSeq, HWRITE.Read, 0x0), 0x55AA0000),
+    ],
+))
+test_ans.generate_tests()
+
+test_ans = TestFactory(test_burst)
+test_ans.add_option('length', (1024,))
+test_ans.add_option('bus_width', (32,))
+test_ans.add_option('sel', (HSEL.Sel, ))
+test_ans.add_option('commands_answers', (
+    [
+        ((0x3E0, HSIZE.Word, HBURST.Incr8, HTRANS.NonSeq, HWRITE.Write, 0x11111111), 0),
+        ((0x3E4, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x22222222), 0),
+        ((0x3E8, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x33333333), 0),
+        ((0x3EC, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x44444444), 0),
+        ((0x3F0, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x55555555), 0),
+        ((0x3F4, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x66666666), 0),
+        ((0x3F8, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x77777777), 0),
+        ((0x3FC, HSIZE.Word, HBURST.Incr8, HTRANS.Seq, HWRITE.Write, 0x88888888), 0),
+        ((0x3E0, HSIZE.Word, HBURST.Single, HTRANS.NonSeq, HWRITE.Read, 0x0), 0x11111111),
+        ((0x3FC, HSIZE.Word, HBURST.Single, HTRANS.NonSeq, HWRITE.Read, 0x0), 0x88888888),
+    ],
 ))
 test_ans.generate_tests()
 